@@ -0,0 +1,168 @@
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import shutil
+import stat
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+BACKUP_PREFIX = 'backup_'
+TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+MANIFEST = 'manifest.json'
+
+# Compression name -> (suffix added to stored files, function opening them for writing/reading)
+COMPRESSIONS = {
+    None: ('', open),
+    'gzip': ('.gz', gzip.open),
+    'xz': ('.xz', lzma.open),
+}
+
+CHUNK_SIZE = 1 << 20
+
+
+class HashingReader:
+    """File wrapper that feeds everything read through it into a SHA-256 digest."""
+
+    def __init__(self, f):
+        self._f = f
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self.digest.update(data)
+        return data
+
+
+def backup_time(path: str) -> Optional[datetime]:
+    """Return when a backup directory was taken, parsed from its name (None if not a backup)."""
+    name = os.path.basename(path)
+    if not name.startswith(BACKUP_PREFIX):
+        return None
+    try:
+        return datetime.strptime(name[len(BACKUP_PREFIX):len(BACKUP_PREFIX) + 15], TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def list_backups(backup_dir: str) -> List[str]:
+    """Return the backup directories in backup_dir, oldest first."""
+    if not os.path.isdir(backup_dir):
+        return []
+    paths = [os.path.join(backup_dir, name) for name in os.listdir(backup_dir)]
+    # A '.partial' directory is a backup still being written (or one that was interrupted)
+    return sorted(path for path in paths
+                  if os.path.isdir(path) and not path.endswith('.partial') and backup_time(path) is not None)
+
+
+def read_manifest(backup_path: str) -> Optional[Dict]:
+    """Return a backup's manifest, or None for a backup taken before manifests existed."""
+    try:
+        with open(os.path.join(backup_path, MANIFEST), 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return None
+
+
+def _copy(source: str, target: str, compression: Optional[str]) -> str:
+    """Stream source into target (compressed if asked) and return the source's SHA-256."""
+    opener = COMPRESSIONS[compression][1]
+    with open(source, 'rb') as src, opener(target, 'wb') as dst:
+        reader = HashingReader(src)
+        shutil.copyfileobj(reader, dst, CHUNK_SIZE)
+    return reader.digest.hexdigest()
+
+
+def create_backup(data_dir: str, files: Iterable[str], backup_dir: str, compression: Optional[str] = None) -> str:
+    """Back up files (paths inside data_dir) into a new directory under backup_dir.
+
+    The backup is incremental against the newest earlier one: a file whose
+    size and modification time match that backup's manifest is hard-linked
+    from it instead of copied, so sealed claim shards and untouched
+    snapshots cost no I/O. Changed files are streamed in chunks, gzip or xz
+    compressed if asked. Backed-up files are made read-only, since hard links
+    share them between backups. The manifest records each file's size,
+    mtime, SHA-256 and stored name; the directory is written under a
+    temporary name and renamed when complete.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression {compression!r}; choose from gzip, xz or None")
+    os.makedirs(backup_dir, exist_ok=True)
+    previous_path = next((path for path in reversed(list_backups(backup_dir)) if read_manifest(path)), None)
+    previous = read_manifest(previous_path)['files'] if previous_path else {}
+
+    now = datetime.now()
+    name = BACKUP_PREFIX + now.strftime(TIMESTAMP_FORMAT)
+    backup_path, suffix = os.path.join(backup_dir, name), 1
+    while os.path.exists(backup_path):
+        backup_path = os.path.join(backup_dir, f"{name}_{suffix}")
+        suffix += 1
+    work_path = backup_path + '.partial'
+    os.makedirs(work_path)
+
+    entries = {}
+    for file_path in files:
+        try:
+            info = os.stat(file_path)
+        except FileNotFoundError:
+            continue
+        relative = os.path.relpath(file_path, data_dir)
+        stored = relative + COMPRESSIONS[compression][0]
+        target = os.path.join(work_path, stored)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        entry = previous.get(relative)
+        if entry is not None and entry['size'] == info.st_size and entry['mtime_ns'] == info.st_mtime_ns \
+                and entry['compression'] == compression:
+            try:
+                os.link(os.path.join(previous_path, entry['stored']), target)
+                entries[relative] = entry
+                continue
+            except OSError:
+                pass  # Missing from the old backup or another file system: copy it instead
+        digest = _copy(file_path, target, compression)
+        os.chmod(target, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        entries[relative] = {'stored': stored, 'size': info.st_size, 'mtime_ns': info.st_mtime_ns,
+                             'sha256': digest, 'compression': compression}
+
+    manifest = {'created': now.isoformat(timespec='microseconds'), 'files': dict(sorted(entries.items()))}
+    with open(os.path.join(work_path, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.rename(work_path, backup_path)
+    return backup_path
+
+
+def open_backup_file(backup_path: str, relative: str):
+    """Open a backed-up file for binary reading, decompressing it if needed."""
+    manifest = read_manifest(backup_path)
+    if manifest is None:
+        return open(os.path.join(backup_path, os.path.basename(relative)), 'rb')
+    entry = manifest['files'][relative]
+    return COMPRESSIONS[entry['compression']][1](os.path.join(backup_path, entry['stored']), 'rb')
+
+
+def prune_backups(backup_dir: str, keep_daily: int = 7, keep_weekly: int = 4) -> List[str]:
+    """Delete backups outside the retention policy and return their paths.
+
+    The newest backup of each of the last keep_daily days and of each of the
+    last keep_weekly ISO weeks is kept, and the newest backup always is.
+    Hard-linked files survive as long as a kept backup still links them.
+    """
+    backups = list_backups(backup_dir)
+    keep = set(backups[-1:])
+    days, weeks = [], []
+    for path in reversed(backups):
+        taken = backup_time(path)
+        day, week = taken.date(), taken.isocalendar()[:2]
+        if day not in days and len(days) < keep_daily:
+            days.append(day)
+            keep.add(path)
+        if week not in weeks and len(weeks) < keep_weekly:
+            weeks.append(week)
+            keep.add(path)
+    removed = []
+    for path in backups:
+        if path not in keep:
+            shutil.rmtree(path)
+            removed.append(path)
+    return removed
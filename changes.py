@@ -0,0 +1,23 @@
+from typing import Callable, Dict, NamedTuple, Optional
+
+# Kinds of change
+ADDED = 'added'
+UPDATED = 'updated'
+DELETED = 'deleted'
+RELOADED = 'reloaded'  # The whole collection was (re)loaded; views should rebuild
+
+
+class ChangeEvent(NamedTuple):
+    """One change to a collection, delivered to DataManager subscribers.
+
+    key is the record's key (member ID, provider ID, service code, username
+    or claim ID) and record the record as it is after the change; both are
+    None for RELOADED, and record is None for DELETED.
+    """
+    collection: str
+    kind: str
+    key: Optional[str] = None
+    record: Optional[Dict] = None
+
+
+Subscriber = Callable[[ChangeEvent], None]
@@ -0,0 +1,146 @@
+from array import array
+from collections import Counter
+from datetime import date
+from typing import Dict, Hashable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # Optional: the pure-Python passes give the same results
+    np = None
+
+# Day ordinal stored for claims whose date of service cannot be parsed
+NO_DATE = 0
+
+
+class CategoryColumn:
+    """Dictionary-encoded column: each distinct value gets a small int code.
+
+    The codes live in a typed array, so grouping by the column is a pass over
+    machine ints (a bincount with NumPy) rather than over Python strings.
+    """
+
+    def __init__(self):
+        self.values: List[Hashable] = []
+        self.codes = array('i')
+        self._code_of: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, value: Hashable):
+        code = self._code_of.get(value)
+        if code is None:
+            code = self._code_of[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def clear(self):
+        self.values.clear()
+        self._code_of.clear()
+        del self.codes[:]
+
+
+class ClaimColumns:
+    """Column-oriented copy of the claim list for aggregate queries.
+
+    Row i describes the claim at position i of DataManager.service_claims:
+    fee as float64, date of service as a day ordinal, and provider, member
+    and service code dictionary-encoded to int codes. Aggregations filter by
+    an optional inclusive date range and then run one pass over the typed
+    arrays; with NumPy installed that pass is vectorized.
+    """
+
+    def __init__(self):
+        self.fee = array('d')
+        self.service_date = array('q')
+        self.provider = CategoryColumn()
+        self.member = CategoryColumn()
+        self.service_code = CategoryColumn()
+
+    def __len__(self) -> int:
+        return len(self.fee)
+
+    def clear(self):
+        """Drop every row."""
+        del self.fee[:]
+        del self.service_date[:]
+        for column in (self.provider, self.member, self.service_code):
+            column.clear()
+
+    def append(self, claim: Dict, ordinal: Optional[int]):
+        """Add a row for claim; ordinal is its parsed date of service."""
+        try:
+            fee = float(claim.get('Fee') or 0.0)
+        except (TypeError, ValueError):
+            fee = 0.0
+        self.fee.append(fee)
+        self.service_date.append(NO_DATE if ordinal is None else ordinal)
+        self.provider.append(claim.get('Provider Number'))
+        self.member.append(claim.get('Member ID'))
+        self.service_code.append(claim.get('Service Code'))
+
+    def truncate(self, length: int):
+        """Drop the rows from position length onward (used by batch rollback)."""
+        del self.fee[length:]
+        del self.service_date[length:]
+        for column in (self.provider, self.member, self.service_code):
+            del column.codes[length:]
+
+    def _rows(self, start: Optional[int], end: Optional[int]):
+        """Return a NumPy mask (or, without NumPy, a list of row numbers) for the date range."""
+        if np is not None:
+            dates = np.frombuffer(self.service_date, dtype=np.int64)
+            mask = np.ones(len(dates), dtype=bool)
+            if start is not None or end is not None:
+                mask &= dates != NO_DATE
+            if start is not None:
+                mask &= dates >= start
+            if end is not None:
+                mask &= dates <= end
+            return mask
+        if start is None and end is None:
+            return None
+        low = start if start is not None else 1
+        high = end if end is not None else date.max.toordinal()
+        return [row for row, ordinal in enumerate(self.service_date) if low <= ordinal <= high]
+
+    def fee_totals_by(self, column: CategoryColumn, start: Optional[int] = None,
+                      end: Optional[int] = None) -> Dict[Hashable, float]:
+        """Sum fees per value of a category column within the date range."""
+        rows = self._rows(start, end)
+        if np is not None:
+            codes = np.frombuffer(column.codes, dtype=np.int32)[rows]
+            fees = np.frombuffer(self.fee, dtype=np.float64)[rows]
+            totals = np.bincount(codes, weights=fees, minlength=len(column.values))
+            present = np.bincount(codes, minlength=len(column.values))
+            return {column.values[code]: float(totals[code]) for code in np.flatnonzero(present)}
+        totals = {}
+        codes, fees = column.codes, self.fee
+        for row in (range(len(fees)) if rows is None else rows):
+            code = codes[row]
+            totals[code] = totals.get(code, 0.0) + fees[row]
+        return {column.values[code]: total for code, total in totals.items()}
+
+    def counts_by(self, column: CategoryColumn, start: Optional[int] = None,
+                  end: Optional[int] = None) -> Dict[Hashable, int]:
+        """Count rows per value of a category column within the date range."""
+        rows = self._rows(start, end)
+        if np is not None:
+            counts = np.bincount(np.frombuffer(column.codes, dtype=np.int32)[rows], minlength=len(column.values))
+            return {column.values[code]: int(counts[code]) for code in np.flatnonzero(counts)}
+        codes = column.codes if rows is None else (column.codes[row] for row in rows)
+        return {column.values[code]: count for code, count in Counter(codes).items()}
+
+    def counts_per_week(self, start: Optional[int] = None, end: Optional[int] = None) -> Dict[date, int]:
+        """Count dated rows per week (keyed by the Monday starting it) within the date range."""
+        rows = self._rows(start, end)
+        # Ordinal 1 (0001-01-01) is a Monday, so (ordinal - 1) // 7 numbers the weeks
+        if np is not None:
+            dates = np.frombuffer(self.service_date, dtype=np.int64)
+            dates = dates[rows]
+            weeks, counts = np.unique((dates[dates != NO_DATE] - 1) // 7, return_counts=True)
+            pairs = zip(weeks.tolist(), counts.tolist())
+        else:
+            dates = self.service_date if rows is None else (self.service_date[row] for row in rows)
+            pairs = Counter((ordinal - 1) // 7 for ordinal in dates if ordinal != NO_DATE).items()
+        return {date.fromordinal(week * 7 + 1): count for week, count in sorted(pairs)}
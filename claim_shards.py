@@ -0,0 +1,298 @@
+import hashlib
+import json
+import os
+import stat
+import threading
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from journal import GroupCommit, JsonLinesJournal, atomic_write
+
+# Shard holding claims whose date of service cannot be parsed
+UNDATED = 'undated'
+
+
+def shard_month(date_of_service) -> str:
+    """Return the YYYY-MM shard of an MM-DD-YYYY date of service (or UNDATED)."""
+    if isinstance(date_of_service, str) and len(date_of_service) == 10 and \
+            date_of_service[2] == '-' and date_of_service[5] == '-':
+        month, year = date_of_service[0:2], date_of_service[6:10]
+        if month.isdigit() and year.isdigit() and 1 <= int(month) <= 12:
+            return f"{year}-{month}"
+    return UNDATED
+
+
+def month_bounds(month: str) -> tuple:
+    """Return the first and last day ordinals of a YYYY-MM shard."""
+    year, number = int(month[:4]), int(month[5:7])
+    first = date(year, number, 1)
+    following = date(year + number // 12, number % 12 + 1, 1)
+    return first.toordinal(), following.toordinal() - 1
+
+
+class ShardedClaimStore:
+    """Service claims partitioned into one JSON-Lines shard per month of service.
+
+    Claims are appended to ``claims/YYYY-MM.jsonl`` by their date of service,
+    so a new claim touches only its month's shard and a date-range read opens
+    only the shards that overlap the range. Once a month is more than
+    seal_after_months old its shard is sealed: its SHA-256, size and record
+    count go into ``claims/manifest.json`` and the file is made read-only, so
+    it can be cached, checksummed and backed up once. A claim that arrives
+    later for a sealed month goes to a ``YYYY-MM.late.jsonl`` side file read
+    together with the shard.
+    """
+
+    def __init__(self, directory: str, committer: Optional[GroupCommit] = None, seal_after_months: int = 1):
+        self.directory = directory
+        self.committer = committer
+        self.seal_after_months = seal_after_months
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+        self._journals: Dict[str, JsonLinesJournal] = {}
+        self._manifest = None
+        self._manifest_mark = None
+        self._lock = threading.RLock()
+
+    # Paths and manifest
+    def shard_path(self, month: str) -> str:
+        return os.path.join(self.directory, f"{month}.jsonl")
+
+    def late_path(self, month: str) -> str:
+        return os.path.join(self.directory, f"{month}.late.jsonl")
+
+    def exists(self) -> bool:
+        """Check whether any claims have been stored in shards yet."""
+        return os.path.isdir(self.directory) and bool(self.months())
+
+    def months(self) -> List[str]:
+        """Return the months that have a shard, oldest first (undated last)."""
+        if not os.path.isdir(self.directory):
+            return []
+        months = set()
+        for name in os.listdir(self.directory):
+            if name.endswith('.jsonl') and not name.endswith('.tmp'):
+                months.add(name.split('.', 1)[0])
+        return sorted(months, key=lambda month: (month == UNDATED, month))
+
+    def files(self) -> List[str]:
+        """Return every shard, late file and the manifest, for backups."""
+        paths = [self.manifest_path]
+        for month in self.months():
+            paths += [self.shard_path(month), self.late_path(month)]
+        return [path for path in paths if os.path.exists(path)]
+
+    def _manifest_stat(self) -> Optional[tuple]:
+        try:
+            info = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return None
+        return info.st_ino, info.st_size, info.st_mtime_ns
+
+    @property
+    def manifest(self) -> Dict[str, Dict]:
+        if self._manifest is None:
+            self._manifest_mark = self._manifest_stat()
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    self._manifest = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self):
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = dict(sorted(self.manifest.items()))
+        atomic_write(self.manifest_path, lambda f: json.dump(manifest, f, indent=2))
+        self._manifest_mark = self._manifest_stat()
+
+    def refresh_manifest(self):
+        """Re-read the manifest if another process changed it, closing shards it has sealed since."""
+        with self._lock:
+            if self._manifest is None or self._manifest_stat() == self._manifest_mark:
+                return
+            self._manifest = None
+            for month in self.manifest:
+                journal = self._journals.pop(self.shard_path(month), None)
+                if journal is not None:
+                    journal.close()
+
+    def is_sealed(self, month: str) -> bool:
+        return month in self.manifest
+
+    def _cutoff(self, today: Optional[date] = None) -> str:
+        """Return the first month that is still open; every earlier month gets sealed."""
+        today = today or date.today()
+        index = today.year * 12 + today.month - 1 - self.seal_after_months
+        return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+    # Writing
+    def _journal(self, path: str) -> JsonLinesJournal:
+        journal = self._journals.get(path)
+        if journal is None:
+            os.makedirs(self.directory, exist_ok=True)
+            journal = self._journals[path] = JsonLinesJournal(path, self.committer)
+        return journal
+
+    def _target(self, month: str) -> str:
+        """Return the file new claims for month are appended to."""
+        return self.late_path(month) if self.is_sealed(month) else self.shard_path(month)
+
+    def append(self, claim: Dict):
+        """Append one claim to its month's shard."""
+        self.append_many([claim])
+
+    def append_many(self, claims: Iterable[Dict]):
+        """Append claims, writing each affected shard once."""
+        by_month: Dict[str, List[Dict]] = {}
+        for claim in claims:
+            by_month.setdefault(shard_month(claim.get('Date of Service')), []).append(claim)
+        with self._lock:
+            for month, month_claims in by_month.items():
+                self._journal(self._target(month)).append_many(month_claims)
+
+    def rewrite(self, claims: Iterable[Dict]):
+        """Replace every shard with the given claims.
+
+        Sealed shards whose content is unchanged are left alone; a sealed month
+        that did change is rewritten, its late file folded in, and resealed.
+        """
+        by_month: Dict[str, List[Dict]] = {}
+        for claim in claims:
+            by_month.setdefault(shard_month(claim.get('Date of Service')), []).append(claim)
+        with self._lock:
+            self.close()
+            os.makedirs(self.directory, exist_ok=True)
+            manifest_changed = False
+            for month in set(self.months()) - set(by_month):
+                for path in (self.shard_path(month), self.late_path(month)):
+                    self._remove(path)
+                manifest_changed |= self.manifest.pop(month, None) is not None
+            for month, month_claims in by_month.items():
+                sealed = self.manifest.get(month)
+                if sealed is not None:
+                    digest = hashlib.sha256()
+                    for claim in month_claims:
+                        digest.update(JsonLinesJournal.encode(claim).encode('utf-8'))
+                    if digest.hexdigest() == sealed['sha256'] and not os.path.exists(self.late_path(month)):
+                        continue
+                self._make_writable(self.shard_path(month))
+                JsonLinesJournal(self.shard_path(month)).rewrite(month_claims)
+                self._remove(self.late_path(month))
+                if sealed is not None:
+                    self.manifest[month] = self._seal_file(month)
+                    manifest_changed = True
+            if manifest_changed:
+                self._save_manifest()
+        self.seal_old_shards()
+
+    # Sealing
+    def seal_old_shards(self, today: Optional[date] = None) -> List[str]:
+        """Seal every unsealed shard older than the open months; returns the months sealed."""
+        cutoff = self._cutoff(today)
+        with self._lock:
+            sealed = []
+            for month in self.months():
+                if month == UNDATED or month >= cutoff or self.is_sealed(month):
+                    continue
+                path = self.shard_path(month)
+                if not os.path.exists(path):
+                    continue  # Only a late file; nothing to seal
+                journal = self._journals.pop(path, None)
+                if journal is not None:
+                    journal.close()
+                self.manifest[month] = self._seal_file(month)
+                sealed.append(month)
+            if sealed:
+                self._save_manifest()
+        return sealed
+
+    def _seal_file(self, month: str) -> Dict:
+        """Checksum a shard and make it read-only; returns its manifest entry."""
+        path = self.shard_path(month)
+        digest, count = hashlib.sha256(), 0
+        with open(path, 'rb') as f:
+            for line in f:
+                digest.update(line)
+                count += 1
+        os.chmod(path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        return {'sha256': digest.hexdigest(), 'size': os.path.getsize(path), 'claims': count}
+
+    def verify(self) -> List[str]:
+        """Return the sealed months whose shard no longer matches its checksum."""
+        damaged = []
+        for month, entry in self.manifest.items():
+            digest = hashlib.sha256()
+            try:
+                with open(self.shard_path(month), 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        digest.update(chunk)
+            except FileNotFoundError:
+                damaged.append(month)
+                continue
+            if digest.hexdigest() != entry['sha256']:
+                damaged.append(month)
+        return damaged
+
+    # Reading
+    def read_month(self, month: str) -> Iterator[Dict]:
+        yield from JsonLinesJournal(self.shard_path(month))
+        yield from JsonLinesJournal(self.late_path(month))
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Stream every claim, month by month."""
+        for month in self.months():
+            yield from self.read_month(month)
+
+    def read_range(self, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[Dict]:
+        """Stream the claims of the shards overlapping an inclusive range of day ordinals.
+
+        Whole shards are returned; callers still filter by the exact dates.
+        """
+        for month in self.months():
+            if month == UNDATED:
+                if start is None and end is None:
+                    yield from self.read_month(month)
+                continue
+            first, last = month_bounds(month)
+            if (start is None or last >= start) and (end is None or first <= end):
+                yield from self.read_month(month)
+
+    def state(self) -> Dict[str, tuple]:
+        """Return the (inode, size) of every shard and late file, to spot writes by other processes."""
+        state = {}
+        for month in self.months():
+            for path in (self.shard_path(month), self.late_path(month)):
+                try:
+                    info = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                state[path] = (info.st_ino, info.st_size)
+        return state
+
+    def size(self) -> int:
+        """Return the total size of the shards in bytes."""
+        return sum(os.path.getsize(path) for path in self.files())
+
+    # Housekeeping
+    def sync(self):
+        """Fsync every open shard."""
+        with self._lock:
+            for journal in self._journals.values():
+                journal.sync()
+
+    def close(self):
+        """Close every open shard."""
+        with self._lock:
+            for journal in self._journals.values():
+                journal.close()
+            self._journals.clear()
+
+    @staticmethod
+    def _make_writable(path: str):
+        if os.path.exists(path):
+            os.chmod(path, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+
+    def _remove(self, path: str):
+        if os.path.exists(path):
+            self._make_writable(path)
+            os.remove(path)
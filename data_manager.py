@@ -1,416 +1,1843 @@
-import json
-import os
-import random
-from datetime import datetime
-from typing import Dict, List, Optional
-
-class DataManager:
-    def __init__(self, data_dir="data"):
-        """Initialize the data manager with a data directory."""
-        self.data_dir = data_dir
-        self.ensure_data_directory()
-        
-        # File paths for different data types
-        self.users_file = os.path.join(data_dir, "users.json")
-        self.members_file = os.path.join(data_dir, "members.json")
-        self.providers_file = os.path.join(data_dir, "providers.json")
-        self.service_claims_file = os.path.join(data_dir, "service_claims.json")
-        self.service_directory_file = os.path.join(data_dir, "service_directory.json")
-        
-        # Initialize data structures
-        self.users = self.load_users()
-        self.members = self.load_members()
-        self.providers = self.load_providers()
-        self.service_claims = self.load_service_claims()
-        self.service_directory = self.load_service_directory()
-        
-        # Initialize with default data if files don't exist
-        self.initialize_default_data()
-    
-    def ensure_data_directory(self):
-        """Create the data directory if it doesn't exist."""
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-    
-    def generate_provider_id(self) -> str:
-        """Generate a unique 9-digit provider ID."""
-        while True:
-            provider_id = str(random.randint(100000000, 999999999))
-            # Check if this ID already exists
-            if not any(p.get('provider_id') == provider_id for p in self.providers):
-                return provider_id
-    
-    def generate_member_id(self) -> str:
-        """Generate a unique 9-digit member ID."""
-        while True:
-            member_id = str(random.randint(100000000, 999999999))
-            # Check if this ID already exists
-            if not any(m.get('member_id') == member_id for m in self.members):
-                return member_id
-    
-    def generate_claim_id(self) -> str:
-        """Generate a unique claim ID."""
-        return str(1000000 + len(self.service_claims) + 1)
-    
-    def initialize_default_data(self):
-        """Initialize with default data if the system is empty."""
-        # Initialize default users if none exist
-        if not self.users:
-            self.users = {
-                'manager': {'username': 'manager', 'password': 'manager123', 'role': 'manager'},
-                'provider': {'username': 'quinn', 'password': 'quinn123', 'role': 'provider'},
-                'mjin': {'username': 'Mjin', 'password': 'Mjin123', 'role': 'manager'}
-            }
-            self.save_users()
-        
-        # Initialize default members if none exist
-        if not self.members:
-            self.members = [
-                {'member_id': '123456789', 'name': 'John Doe', 'status': 'Valid', 'address': '123 Main St', 'city': 'Anytown', 'state': 'CA', 'zip': '12345'},
-                {'member_id': '543210987', 'name': 'Jane Smith', 'status': 'Expired', 'address': '456 Elm St', 'city': 'Othertown', 'state': 'NY', 'zip': '67890'},
-                {'member_id': '333333333', 'name': 'Bob Johnson', 'status': 'Valid', 'address': '789 Oak St', 'city': 'Smalltown', 'state': 'TX', 'zip': '34567'},
-            ]
-            self.save_members()
-        
-        # Initialize default service directory if none exists
-        if not self.service_directory:
-            self.service_directory = [
-                {'code': '100001', 'name': 'Therapy Session', 'fee': 100.00},
-                {'code': '100002', 'name': 'Dental Cleaning', 'fee': 80.00},
-                {'code': '100003', 'name': 'Vision Exam', 'fee': 60.00},
-                {'code': '100004', 'name': 'Physical Therapy', 'fee': 120.00},
-                {'code': '100005', 'name': 'Nutrition Counseling', 'fee': 75.00},
-                {'code': '100006', 'name': 'Psychological Therapy', 'fee': 150.00},
-                {'code': '100007', 'name': 'Occupational Therapy', 'fee': 110.00},
-                {'code': '100008', 'name': 'Speech Therapy', 'fee': 95.00},
-                {'code': '100009', 'name': 'Massage Therapy', 'fee': 85.00},
-                {'code': '100010', 'name': 'Chiropractic Adjustment', 'fee': 90.00},
-                {'code': '100011', 'name': 'Acupuncture Session', 'fee': 70.00},
-                {'code': '100012', 'name': 'Dental X-Ray', 'fee': 45.00},
-                {'code': '100013', 'name': 'Eye Glasses Fitting', 'fee': 55.00},
-                {'code': '100014', 'name': 'Hearing Test', 'fee': 65.00},
-                {'code': '100015', 'name': 'Blood Pressure Check', 'fee': 25.00},
-                {'code': '100016', 'name': 'Diabetes Screening', 'fee': 40.00},
-                {'code': '100017', 'name': 'Flu Shot', 'fee': 30.00},
-                {'code': '100018', 'name': 'Smoking Cessation Program', 'fee': 200.00},
-                {'code': '100019', 'name': 'Weight Loss Consultation', 'fee': 85.00},
-                {'code': '100020', 'name': 'Stress Management Session', 'fee': 95.00},
-            ]
-            self.save_service_directory()
-    
-    # User management methods
-    def load_users(self) -> Dict:
-        """Load users from JSON file."""
-        try:
-            if os.path.exists(self.users_file):
-                with open(self.users_file, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
-        return {}
-    
-    def save_users(self):
-        """Save users to JSON file."""
-        with open(self.users_file, 'w') as f:
-            json.dump(self.users, f, indent=2)
-    
-    def add_user(self, username: str, password: str, role: str) -> bool:
-        """Add a new user."""
-        if username in self.users:
-            return False  # User already exists
-        
-        self.users[username] = {
-            'username': username,
-            'password': password,
-            'role': role
-        }
-        self.save_users()
-        return True
-    
-    def authenticate_user(self, username: str, password: str, role: str) -> bool:
-        """Authenticate a user."""
-        # Find user by username (case-sensitive)
-        user = next((u for u in self.users.values() if u['username'] == username), None)
-        if user and user['password'] == password and user['role'] == role:
-            return True
-        return False
-    
-    # Member management methods
-    def load_members(self) -> List[Dict]:
-        """Load members from JSON file."""
-        try:
-            if os.path.exists(self.members_file):
-                with open(self.members_file, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
-        return []
-    
-    def save_members(self):
-        """Save members to JSON file."""
-        with open(self.members_file, 'w') as f:
-            json.dump(self.members, f, indent=2)
-    
-    def add_member(self, name: str, address: str, city: str, state: str, zip_code: str) -> str:
-        """Add a new member and return the generated member ID."""
-        member_id = self.generate_member_id()
-        member = {
-            'member_id': member_id,
-            'name': name,
-            'address': address,
-            'city': city,
-            'state': state.upper(),
-            'zip': zip_code,
-            'status': 'Valid'
-        }
-        self.members.append(member)
-        self.save_members()
-        return member_id
-    
-    def get_member(self, member_id: str) -> Optional[Dict]:
-        """Get a member by ID."""
-        return next((m for m in self.members if m['member_id'] == member_id), None)
-    
-    def update_member(self, member_id: str, **kwargs) -> bool:
-        """Update member information."""
-        member = self.get_member(member_id)
-        if member:
-            member.update(kwargs)
-            self.save_members()
-            return True
-        return False
-    
-    def delete_member(self, member_id: str) -> bool:
-        """Delete a member."""
-        member = self.get_member(member_id)
-        if member:
-            self.members.remove(member)
-            self.save_members()
-            return True
-        return False
-    
-    def renew_member(self, member_id: str) -> bool:
-        """Renew an expired member."""
-        member = self.get_member(member_id)
-        if member and member['status'] == 'Expired':
-            member['status'] = 'Valid'
-            self.save_members()
-            return True
-        return False
-    
-    # Provider management methods
-    def load_providers(self) -> List[Dict]:
-        """Load providers from JSON file."""
-        try:
-            if os.path.exists(self.providers_file):
-                with open(self.providers_file, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
-        return []
-    
-    def save_providers(self):
-        """Save providers to JSON file."""
-        with open(self.providers_file, 'w') as f:
-            json.dump(self.providers, f, indent=2)
-    
-    def add_provider(self, name: str, address: str, city: str, state: str, zip_code: str) -> str:
-        """Add a new provider and return the generated provider ID."""
-        provider_id = self.generate_provider_id()
-        provider = {
-            'provider_id': provider_id,
-            'name': name,
-            'address': address,
-            'city': city,
-            'state': state.upper(),
-            'zip': zip_code
-        }
-        self.providers.append(provider)
-        self.save_providers()
-        
-        # Create a user account for the provider
-        username = name.lower().replace(' ', '')  # Create username from name
-        password = f"{provider_id}"  # Use provider ID as initial password
-        self.add_user(username, password, 'provider')
-        
-        return provider_id
-    
-    def get_provider(self, provider_id: str) -> Optional[Dict]:
-        """Get a provider by ID."""
-        return next((p for p in self.providers if p.get('provider_id') == provider_id), None)
-    
-    def get_provider_by_username(self, username: str) -> Optional[Dict]:
-        """Get a provider by username."""
-        # Find the user first
-        user = next((u for u in self.users.values() if u['username'] == username), None)
-        if user and user['role'] == 'provider':
-            # Find the provider by name (assuming username is derived from name)
-            provider_name = username.replace('', ' ').title()  # Convert username back to name
-            return next((p for p in self.providers if p['name'].lower().replace(' ', '') == username), None)
-        return None
-    
-    def update_provider(self, provider_id: str, **kwargs) -> bool:
-        """Update provider information."""
-        provider = self.get_provider(provider_id)
-        if provider:
-            provider.update(kwargs)
-            self.save_providers()
-            return True
-        return False
-    
-    def delete_provider(self, provider_id: str) -> bool:
-        """Delete a provider."""
-        provider = self.get_provider(provider_id)
-        if provider:
-            self.providers.remove(provider)
-            self.save_providers()
-            return True
-        return False
-    
-    # Service claims management methods
-    def load_service_claims(self) -> List[Dict]:
-        """Load service claims from JSON file."""
-        try:
-            if os.path.exists(self.service_claims_file):
-                with open(self.service_claims_file, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
-        return []
-    
-    def save_service_claims(self):
-        """Save service claims to JSON file."""
-        with open(self.service_claims_file, 'w') as f:
-            json.dump(self.service_claims, f, indent=2)
-    
-    def add_service_claim(self, member_id: str, date_of_service: str, provider_number: str, 
-                         service_code: str, comments: str = "") -> str:
-        """Add a new service claim and return the claim ID."""
-        # Get service information
-        service = self.get_service(service_code)
-        if not service:
-            raise ValueError(f"Service code {service_code} not found")
-        
-        claim_id = self.generate_claim_id()
-        current_datetime = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
-        
-        claim = {
-            'Claim ID': claim_id,
-            'Current Date/Time': current_datetime,
-            'Date of Service': date_of_service,
-            'Provider Number': provider_number,
-            'Member ID': member_id,
-            'Service Code': service_code,
-            'Service Name': service['name'],
-            'Fee': service['fee'],
-            'Comments': comments,
-            'Status': 'Pending'
-        }
-        
-        self.service_claims.append(claim)
-        self.save_service_claims()
-        return claim_id
-    
-    # Service directory management methods
-    def load_service_directory(self) -> List[Dict]:
-        """Load service directory from JSON file."""
-        try:
-            if os.path.exists(self.service_directory_file):
-                with open(self.service_directory_file, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
-        return []
-    
-    def save_service_directory(self):
-        """Save service directory to JSON file."""
-        with open(self.service_directory_file, 'w') as f:
-            json.dump(self.service_directory, f, indent=2)
-    
-    def get_service(self, service_code: str) -> Optional[Dict]:
-        """Get a service by code."""
-        return next((s for s in self.service_directory if s['code'] == service_code), None)
-    
-    def search_services(self, search_term: str) -> List[Dict]:
-        """Search services by code or name."""
-        search_term = search_term.lower()
-        return [
-            s for s in self.service_directory
-            if search_term in s['code'].lower() or search_term in s['name'].lower()
-        ]
-    
-    def add_service(self, code: str, name: str, fee: float) -> bool:
-        """Add a new service to the directory."""
-        if self.get_service(code):
-            return False  # Service code already exists
-        
-        service = {
-            'code': code,
-            'name': name,
-            'fee': fee
-        }
-        self.service_directory.append(service)
-        self.save_service_directory()
-        return True
-    
-    def update_service(self, code: str, **kwargs) -> bool:
-        """Update service information."""
-        service = self.get_service(code)
-        if service:
-            service.update(kwargs)
-            self.save_service_directory()
-            return True
-        return False
-    
-    def delete_service(self, code: str) -> bool:
-        """Delete a service from the directory."""
-        service = self.get_service(code)
-        if service:
-            self.service_directory.remove(service)
-            self.save_service_directory()
-            return True
-        return False
-    
-    # Utility methods
-    def get_expired_members(self) -> List[Dict]:
-        """Get all expired members."""
-        return [m for m in self.members if m['status'] == 'Expired']
-    
-    def get_valid_members(self) -> List[Dict]:
-        """Get all valid members."""
-        return [m for m in self.members if m['status'] == 'Valid']
-    
-    def get_pending_claims(self) -> List[Dict]:
-        """Get all pending service claims."""
-        return [c for c in self.service_claims if c['Status'] == 'Pending']
-    
-    def get_approved_claims(self) -> List[Dict]:
-        """Get all approved service claims."""
-        return [c for c in self.service_claims if c['Status'] == 'Approved']
-    
-    def backup_data(self, backup_dir: str = "backup"):
-        """Create a backup of all data files."""
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = os.path.join(backup_dir, f"backup_{timestamp}")
-        os.makedirs(backup_path)
-        
-        # Copy all data files
-        files_to_backup = [
-            self.users_file,
-            self.members_file,
-            self.providers_file,
-            self.service_claims_file,
-            self.service_directory_file
-        ]
-        
-        for file_path in files_to_backup:
-            if os.path.exists(file_path):
-                filename = os.path.basename(file_path)
-                backup_file = os.path.join(backup_path, filename)
-                with open(file_path, 'r') as src, open(backup_file, 'w') as dst:
-                    dst.write(src.read())
-        
-        return backup_path 
\ No newline at end of file
+import atexit
+import copy
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from backup import create_backup, list_backups, prune_backups, read_manifest
+from changes import ADDED, DELETED, RELOADED, UPDATED, ChangeEvent, Subscriber
+from claim_columns import ClaimColumns
+from claim_shards import ShardedClaimStore
+from id_allocator import SequenceAllocator, allocate_random_id
+from indexes import HashIndex, PrefixIndex, SortedIndex, TrigramIndex, lookup
+from journal import GroupCommit, JsonLinesJournal, MutationLog, ProcessLock
+from member_store import MemberStore, build_member_store
+from records import RECORD_TYPES, Claim, as_records
+from serialization import CODECS, CodecError, get_codec, read_file, write_file
+
+# Directory (inside the data directory) holding compacted log segments for restores
+WAL_ARCHIVE_DIR = "wal_archive"
+# File in the archive holding the newest segment stamp deleted by age, which
+# restore needs to know to refuse rolling forward across the gap
+WAL_ARCHIVE_PRUNED = "pruned_through"
+
+# Collections stored as a snapshot file plus a write-ahead log, mapped to the
+# field their records are keyed by (users are already a dict keyed by name)
+SNAPSHOT_COLLECTIONS = {
+    'users': None,
+    'members': 'member_id',
+    'providers': 'provider_id',
+    'service_directory': 'code',
+}
+
+
+def provider_username(name: str) -> str:
+    """Derive a provider's login username from the provider name."""
+    return name.lower().replace(' ', '')
+
+
+# Secondary indexes per collection: field name -> function deriving the value
+# (None indexes the stored field itself)
+SECONDARY_INDEXES = {
+    'members': {'status': None, 'state': None, 'zip': None},
+    'providers': {'username': lambda provider: provider_username(provider['name'])},
+}
+
+# Trigram text indexes per collection: collection -> fields searched
+TEXT_INDEXES = {
+    'service_directory': ('code', 'name'),
+    'members': ('name', 'address'),
+}
+
+# Search indexes ('text': trigrams, 'prefix': sorted keys for completion) are
+# built on the first search, kept among the secondary indexes while the
+# collection changes, and dropped when it is reloaded
+SEARCH_INDEXES = ('text', 'prefix')
+
+# Claim fields with a maintained hash index (the date of service has a sorted one)
+CLAIM_INDEXES = ('Member ID', 'Provider Number', 'Service Code')
+
+# Marks a field that did not exist before an update (for batch rollback)
+_MISSING = object()
+
+
+def service_date_ordinal(day: Union[str, date, None]) -> Optional[int]:
+    """Convert an MM-DD-YYYY string or a date to a day ordinal (None if unparseable)."""
+    if isinstance(day, date):
+        return day.toordinal()
+    if isinstance(day, str) and len(day) == 10 and day[2] == '-' and day[5] == '-' and \
+            day[:2].isdigit() and day[3:5].isdigit() and day[6:].isdigit():
+        # Fast path for the usual format: strptime dominates scans over many claims
+        try:
+            return date(int(day[6:]), int(day[:2]), int(day[3:5])).toordinal()
+        except ValueError:
+            return None
+    try:
+        return datetime.strptime(day, "%m-%d-%Y").toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def apply_mutation(records: Dict, entry: Dict):
+    """Apply one write-ahead log entry to a dict of records keyed by ID."""
+    op, key = entry['op'], entry['key']
+    if op == 'add':
+        records[key] = entry['data']
+    elif op == 'delete':
+        records.pop(key, None)
+    elif key in records:
+        # 'update' and 'renew' both carry the changed fields
+        records[key].update(entry.get('data') or {})
+
+
+# Default records seeded into a collection that is empty when first loaded
+DEFAULT_DATA = {
+    'users': {
+        'manager': {'username': 'manager', 'password': 'manager123', 'role': 'manager'},
+        'provider': {'username': 'quinn', 'password': 'quinn123', 'role': 'provider'},
+        'mjin': {'username': 'Mjin', 'password': 'Mjin123', 'role': 'manager'}
+    },
+    'members': [
+        {'member_id': '123456789', 'name': 'John Doe', 'status': 'Valid', 'address': '123 Main St', 'city': 'Anytown', 'state': 'CA', 'zip': '12345'},
+        {'member_id': '543210987', 'name': 'Jane Smith', 'status': 'Expired', 'address': '456 Elm St', 'city': 'Othertown', 'state': 'NY', 'zip': '67890'},
+        {'member_id': '333333333', 'name': 'Bob Johnson', 'status': 'Valid', 'address': '789 Oak St', 'city': 'Smalltown', 'state': 'TX', 'zip': '34567'},
+    ],
+    'service_directory': [
+        {'code': '100001', 'name': 'Therapy Session', 'fee': 100.00},
+        {'code': '100002', 'name': 'Dental Cleaning', 'fee': 80.00},
+        {'code': '100003', 'name': 'Vision Exam', 'fee': 60.00},
+        {'code': '100004', 'name': 'Physical Therapy', 'fee': 120.00},
+        {'code': '100005', 'name': 'Nutrition Counseling', 'fee': 75.00},
+        {'code': '100006', 'name': 'Psychological Therapy', 'fee': 150.00},
+        {'code': '100007', 'name': 'Occupational Therapy', 'fee': 110.00},
+        {'code': '100008', 'name': 'Speech Therapy', 'fee': 95.00},
+        {'code': '100009', 'name': 'Massage Therapy', 'fee': 85.00},
+        {'code': '100010', 'name': 'Chiropractic Adjustment', 'fee': 90.00},
+        {'code': '100011', 'name': 'Acupuncture Session', 'fee': 70.00},
+        {'code': '100012', 'name': 'Dental X-Ray', 'fee': 45.00},
+        {'code': '100013', 'name': 'Eye Glasses Fitting', 'fee': 55.00},
+        {'code': '100014', 'name': 'Hearing Test', 'fee': 65.00},
+        {'code': '100015', 'name': 'Blood Pressure Check', 'fee': 25.00},
+        {'code': '100016', 'name': 'Diabetes Screening', 'fee': 40.00},
+        {'code': '100017', 'name': 'Flu Shot', 'fee': 30.00},
+        {'code': '100018', 'name': 'Smoking Cessation Program', 'fee': 200.00},
+        {'code': '100019', 'name': 'Weight Loss Consultation', 'fee': 85.00},
+        {'code': '100020', 'name': 'Stress Management Session', 'fee': 95.00},
+    ],
+}
+
+
+class DataManager:
+    def __init__(self, data_dir="data", compact_threshold: int = 1024 * 1024,
+                 compact_interval: Optional[float] = 300.0, commit_window: float = 0.0,
+                 claim_id_block: int = 64, write_behind: Optional[float] = None,
+                 codecs: Optional[Dict[str, str]] = None, member_store: bool = False,
+                 archive_wal: bool = True, wal_archive_age: Optional[float] = 7 * 86400.0,
+                 shared: bool = False, refresh_interval: float = 1.0):
+        """Initialize the data manager with a data directory.
+        
+        Mutations are appended to a per-collection write-ahead log. The logs are
+        folded into the snapshot files once one grows past compact_threshold
+        bytes or compact_interval seconds pass (None disables the background
+        compactor; the size threshold then compacts inline).
+        
+        Every logged change is fsynced before the call returns. A positive
+        commit_window (in seconds) enables group commit: the change waits up to
+        the window so that changes other threads make meanwhile share its fsync.
+        
+        Claim IDs come from a persisted sequence; each process reserves
+        claim_id_block IDs at a time so several terminals can issue claims
+        without taking the sequence lock on every insert.
+        
+        codecs picks the snapshot format per collection, e.g.
+        {'members': 'binary'}; the rest stay pretty JSON. See serialization.py.
+        
+        member_store keeps a memory-mapped, fixed-width copy of the members
+        snapshot (members.fw) next to it. Until the member list is loaded,
+        get_member() binary-searches that file and overlays the members log
+        instead of parsing every member.
+        
+        Nothing is read at construction: each collection is loaded the first
+        time it is accessed, and the claim history only when a claim feature
+        needs it.
+        
+        write_behind (seconds) enables write-behind mode: mutations and saves
+        only update memory and mark their collection dirty, and a background
+        thread writes them once no change has arrived for write_behind seconds
+        (or at most ten intervals after the first one). flush() writes
+        everything queued; it also runs at interpreter exit and in close().
+        
+        With archive_wal, compaction moves each folded log segment into
+        wal_archive/ instead of deleting it, so restore.py can roll a backup
+        forward to any later moment. backup_data() drops segments older than
+        the oldest backup, and compaction drops those archived more than
+        wal_archive_age seconds ago (default a week; None keeps them), so the
+        archive stays bounded even if no backup is ever taken.
+        
+        shared makes it safe for several processes (e.g. two front-desk
+        terminals) to use the same data directory. Every mutation holds an
+        fcntl lock on its collection's lock file, first catches up on what
+        other processes wrote, and is written through to the log at once
+        rather than queued, so no update is lost to another process's check;
+        write-behind then defers only snapshot saves, which the flusher
+        writes under the same lock. Catching up compares the
+        snapshot and log with what this instance last saw: new log lines are
+        read from the old end of the log and applied, and only a collection
+        whose snapshot was rewritten is reloaded. Reads check at most every
+        refresh_interval seconds.
+        """
+        self.data_dir = data_dir
+        self.ensure_data_directory()
+        self.group_commit = GroupCommit(commit_window)
+        self.setup_files()
+        for collection, codec_name in (codecs or {}).items():
+            if collection not in SNAPSHOT_COLLECTIONS:
+                raise ValueError(f"Unknown collection {collection!r}")
+            self.codecs[collection] = get_codec(codec_name)
+        self.claim_sequence = SequenceAllocator(self.sequences_file, 'claim', start=1000001,
+                                                block_size=claim_id_block)
+        self._claim_id_floor = 0
+        
+        self.compact_threshold = compact_threshold
+        self.compact_interval = compact_interval
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compact_requested = threading.Event()
+        self._closed = threading.Event()
+        self._compactor = None
+        
+        # Hash indexes from record key to record for the keyed collections
+        self._by_key = {name: {} for name, key_field in SNAPSHOT_COLLECTIONS.items() if key_field}
+        # List position of each keyed record, by identity, so a removal can
+        # move the last record into the gap instead of shifting the list
+        self._positions = {name: {} for name in self._by_key}
+        self._secondary = {
+            name: {field: HashIndex(field, derive) for field, derive in fields.items()}
+            for name, fields in SECONDARY_INDEXES.items()
+        }
+        self._user_keys = {}  # username -> key in the users dict
+        # Claims are indexed by their position in service_claims (they are never removed)
+        self._claim_indexes = {field: HashIndex(field) for field in CLAIM_INDEXES}
+        self._claim_dates = SortedIndex()
+        self._claim_columns = ClaimColumns()  # Typed columns for aggregate queries
+        
+        # Batch state: while a batch is open on the owning thread, log entries
+        # are buffered and an undo log records how to roll memory back
+        self._batch_depth = 0
+        self._batch_owner = None
+        self._batch_entries = {}
+        self._batch_claims = []
+        self._batch_snapshots = set()
+        self._undo = None
+        
+        # Change subscribers and the events waiting to be delivered to them
+        self._subscribers = []
+        self._events = []
+        
+        # Write-behind state: queued log entries, claims and dirty snapshots
+        # waiting for the background flusher
+        self.write_behind = write_behind
+        self._flush_cond = threading.Condition()
+        self._flush_io_lock = threading.Lock()
+        self._pending_entries = {}
+        self._pending_claims = []
+        self._dirty = set()
+        self._first_change = None
+        self._last_change = None
+        self._flusher = None
+        
+        # Collections are loaded (and seeded with defaults if empty) on first
+        # access, so signing in only reads users and never the claim history
+        self._loaded = set()
+        
+        self.use_member_store = member_store
+        self.archive_wal = archive_wal
+        self.wal_archive_age = wal_archive_age
+        
+        # Multi-process state: the file state each collection was last in sync
+        # with, when reads last checked it, and the process locks a batch holds
+        self.shared = shared
+        self.refresh_interval = refresh_interval
+        self._seen = {}
+        self._checked = {}
+        self._batch_locks = []
+        self._local = threading.local()
+        self._member_store = None
+        self._member_overlay = {}
+        self._overlay_mark = None
+        
+        # Background backups: one at a time, joined on close()
+        self._backup_lock = threading.Lock()
+        self._backup_threads = []
+        self.last_backup = None
+        
+        if compact_interval is not None:
+            self._compactor = threading.Thread(target=self._compaction_loop, name="wal-compactor", daemon=True)
+            self._compactor.start()
+        if write_behind is not None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="write-behind", daemon=True)
+            self._flusher.start()
+            atexit.register(self.flush)
+    
+    def setup_files(self):
+        """Set up the data file paths, the claim journal and the write-ahead logs."""
+        # File paths for different data types
+        self.users_file = os.path.join(self.data_dir, "users.json")
+        self.members_file = os.path.join(self.data_dir, "members.json")
+        self.providers_file = os.path.join(self.data_dir, "providers.json")
+        self.claims_dir = os.path.join(self.data_dir, "claims")
+        # Earlier claim layouts, migrated into the monthly shards on first load
+        self.service_claims_file = os.path.join(self.data_dir, "service_claims.jsonl")
+        self.legacy_service_claims_file = os.path.join(self.data_dir, "service_claims.json")
+        self.service_directory_file = os.path.join(self.data_dir, "service_directory.json")
+        self.sequences_file = os.path.join(self.data_dir, "sequences.json")
+        self.member_store_file = os.path.join(self.data_dir, "members.fw")
+        self.wal_archive_dir = os.path.join(self.data_dir, WAL_ARCHIVE_DIR)
+        
+        # Claims are append-only, so they live in JSON-Lines shards, one per month of service
+        self.claim_journal = ShardedClaimStore(self.claims_dir, self.group_commit)
+        
+        # Every other collection is a snapshot plus a log of later mutations
+        self.snapshot_files = {
+            'users': self.users_file,
+            'members': self.members_file,
+            'providers': self.providers_file,
+            'service_directory': self.service_directory_file,
+        }
+        self.process_locks = {
+            name: ProcessLock(os.path.join(self.data_dir, f"{name}.lock"))
+            for name in list(SNAPSHOT_COLLECTIONS) + ['service_claims']
+        }
+        self.wals = {
+            name: MutationLog(os.path.join(self.data_dir, f"{name}.wal"), self.group_commit)
+            for name in SNAPSHOT_COLLECTIONS
+        }
+        # Snapshots are pretty JSON unless another codec is chosen per collection
+        self.codecs = {name: get_codec('json-pretty') for name in SNAPSHOT_COLLECTIONS}
+    
+    def ensure_data_directory(self):
+        """Create the data directory if it doesn't exist."""
+        if not os.path.exists(self.data_dir):
+            os.makedirs(self.data_dir)
+    
+    def generate_provider_id(self) -> str:
+        """Generate a unique 9-digit provider ID."""
+        # The primary key index doubles as the set of IDs in use
+        return allocate_random_id(self._keyed('providers'))
+    
+    def generate_member_id(self) -> str:
+        """Generate a unique 9-digit member ID."""
+        return allocate_random_id(self._keyed('members'))
+    
+    def generate_claim_id(self) -> str:
+        """Generate a unique claim ID from the persisted claim sequence."""
+        # A new sequence is seeded above any claim written before the sequence
+        # file existed; only then is the claim history needed to compute that
+        # floor. Afterwards the reserved blocks alone decide.
+        floor = 0
+        if not os.path.exists(self.sequences_file):
+            self._ensure_loaded('service_claims')
+            floor = self._claim_id_floor
+        return str(self.claim_sequence.next(floor))
+    
+    def initialize_default_data(self):
+        """Initialize with default data if the system is empty."""
+        for collection in DEFAULT_DATA:
+            if not getattr(self, collection):
+                self.seed_defaults(collection)
+    
+    def seed_defaults(self, collection: str):
+        """Fill a collection with its default records and save it."""
+        setattr(self, collection, copy.deepcopy(DEFAULT_DATA[collection]))
+        getattr(self, f"save_{collection}")()
+    
+    def _ensure_loaded(self, collection: str):
+        """Load a collection the first time it is used, seeding defaults if it is empty."""
+        if collection in self._loaded:
+            if self.shared and not getattr(self._local, 'depth', 0) and not self._in_batch():
+                self._check_for_changes(collection)
+            return
+        with self._synced(collection):
+            if collection in self._loaded:
+                return
+            setattr(self, collection, getattr(self, f"load_{collection}")())
+            # Seen before seeding, so saving the defaults doesn't reload the empty copy
+            self._note_written(collection)
+            if collection in DEFAULT_DATA and not getattr(self, collection):
+                self.seed_defaults(collection)
+    
+    def _keyed(self, collection: str) -> Dict[str, Dict]:
+        """Return a collection's key index, loading the collection if needed."""
+        self._ensure_loaded(collection)
+        return self._by_key[collection]
+    
+    # Collections load on first access; assigning one converts its records
+    # to the compact record classes and rebuilds its indexes
+    @property
+    def users(self) -> Dict:
+        self._ensure_loaded('users')
+        return self._users
+    
+    @users.setter
+    def users(self, users: Dict):
+        self._loaded.add('users')
+        self._users = users
+        self.rebuild_user_index()
+        self._notify('users', RELOADED)
+    
+    @property
+    def members(self) -> List[Dict]:
+        self._ensure_loaded('members')
+        return self._members
+    
+    @members.setter
+    def members(self, members: List[Dict]):
+        self._loaded.add('members')
+        self._members = as_records('members', members)
+        self.rebuild_indexes('members')
+        self._notify('members', RELOADED)
+    
+    @property
+    def providers(self) -> List[Dict]:
+        self._ensure_loaded('providers')
+        return self._providers
+    
+    @providers.setter
+    def providers(self, providers: List[Dict]):
+        self._loaded.add('providers')
+        self._providers = as_records('providers', providers)
+        self.rebuild_indexes('providers')
+        self._notify('providers', RELOADED)
+    
+    @property
+    def service_directory(self) -> List[Dict]:
+        self._ensure_loaded('service_directory')
+        return self._service_directory
+    
+    @service_directory.setter
+    def service_directory(self, services: List[Dict]):
+        self._loaded.add('service_directory')
+        self._service_directory = as_records('service_directory', services)
+        self.rebuild_indexes('service_directory')
+        self._notify('service_directory', RELOADED)
+    
+    @property
+    def service_claims(self) -> List[Dict]:
+        self._ensure_loaded('service_claims')
+        return self._service_claims
+    
+    @service_claims.setter
+    def service_claims(self, claims: List[Dict]):
+        self._loaded.add('service_claims')
+        self._service_claims = as_records('service_claims', claims)
+        self.rebuild_claim_indexes()
+        self._notify('service_claims', RELOADED)
+    
+    # Index maintenance methods
+    def rebuild_user_index(self):
+        """Rebuild the username index (user keys and usernames can differ)."""
+        self._user_keys = {}
+        for key, user in self.users.items():
+            self._user_keys.setdefault(user['username'], key)
+    
+    def rebuild_claim_indexes(self):
+        """Rebuild the claim indexes from the current claim list."""
+        for index in self._claim_indexes.values():
+            index.clear()
+        self._claim_dates.clear()
+        self._claim_columns.clear()
+        self._claim_id_floor = 0
+        dated = []
+        for position, claim in enumerate(self.service_claims):
+            self._index_claim(position, claim, dated)
+        # One sort rather than an insert per claim, which is quadratic when
+        # the shards are not in date-of-service order
+        self._claim_dates.bulk_load(dated)
+    
+    def _index_claim(self, position: int, claim: Dict, dated: Optional[List] = None):
+        """Add the claim at the given list position to the claim indexes.
+        
+        With dated given, its (ordinal, position) pair is collected there for
+        a bulk load instead of being inserted into the date index.
+        """
+        for index in self._claim_indexes.values():
+            index.add(position, claim)
+        ordinal = service_date_ordinal(claim.get('Date of Service'))
+        if ordinal is not None:
+            if dated is not None:
+                dated.append((ordinal, position))
+            else:
+                self._claim_dates.add(ordinal, position)
+        self._claim_columns.append(claim, ordinal)
+        claim_id = str(claim.get('Claim ID', ''))
+        if claim_id.isdigit():
+            self._claim_id_floor = max(self._claim_id_floor, int(claim_id) + 1)
+    
+    def _unindex_claim(self, position: int, claim: Dict):
+        """Remove the claim at the given list position from the claim indexes."""
+        for index in self._claim_indexes.values():
+            index.remove(position, claim)
+        ordinal = service_date_ordinal(claim.get('Date of Service'))
+        if ordinal is not None:
+            self._claim_dates.remove(ordinal, position)
+        self._claim_columns.truncate(position)
+    
+    def _search_index(self, collection: str, name: str):
+        """Return a collection's 'text' or 'prefix' search index, building it on first use."""
+        self._ensure_loaded(collection)
+        index = self._secondary.get(collection, {}).get(name)
+        if index is not None:
+            return index
+        with self._lock:
+            indexes = self._secondary.setdefault(collection, {})
+            if name not in indexes:
+                records = self._by_key[collection]
+                if name == 'prefix':
+                    index = PrefixIndex(records)
+                else:
+                    index = TrigramIndex(TEXT_INDEXES[collection])
+                    for key, record in records.items():
+                        index.add(key, record)
+                indexes[name] = index
+            return indexes[name]
+    
+    def rebuild_indexes(self, collection: str):
+        """Rebuild every index of a collection from its current records."""
+        self._by_key[collection] = {}
+        indexes = self._secondary.get(collection, {})
+        for name in SEARCH_INDEXES:
+            indexes.pop(name, None)  # Built again by the next search
+        for index in indexes.values():
+            index.clear()
+        records = getattr(self, collection)
+        self._positions[collection] = {id(record): position for position, record in enumerate(records)}
+        for record in records:
+            self._index_record(collection, record)
+    
+    def _index_record(self, collection: str, record: Dict):
+        """Add a record to the indexes of its collection."""
+        key = record[SNAPSHOT_COLLECTIONS[collection]]
+        self._by_key[collection][key] = record
+        for index in self._secondary.get(collection, {}).values():
+            index.add(key, record)
+    
+    def _unindex_record(self, collection: str, record: Dict):
+        """Remove a record from the indexes of its collection."""
+        key = record[SNAPSHOT_COLLECTIONS[collection]]
+        self._by_key[collection].pop(key, None)
+        for index in self._secondary.get(collection, {}).values():
+            index.remove(key, record)
+    
+    def _add_record(self, collection: str, record: Dict):
+        """Append a new record to a keyed collection and index it."""
+        record = RECORD_TYPES[collection](record)
+        records = getattr(self, collection)
+        self._positions[collection][id(record)] = len(records)
+        records.append(record)
+        self._index_record(collection, record)
+        if self._undo is not None:
+            self._undo.append(('add', collection, record))
+        self._notify(collection, ADDED, record[SNAPSHOT_COLLECTIONS[collection]], record)
+    
+    def _update_record(self, collection: str, record: Dict, fields: Dict):
+        """Update a record in place, keeping the indexes consistent."""
+        if self._undo is not None:
+            self._undo.append(('update', collection, record, {f: record.get(f, _MISSING) for f in fields}))
+        self._unindex_record(collection, record)
+        record.update(fields)
+        self._index_record(collection, record)
+        self._notify(collection, UPDATED, record[SNAPSHOT_COLLECTIONS[collection]], record)
+    
+    def _remove_record(self, collection: str, record: Dict):
+        """Remove a record from a keyed collection and its indexes."""
+        self._unindex_record(collection, record)
+        position = self._take_out(collection, record)
+        if self._undo is not None:
+            self._undo.append(('remove', collection, record, position))
+        self._notify(collection, DELETED, record[SNAPSHOT_COLLECTIONS[collection]])
+    
+    def _take_out(self, collection: str, record: Dict) -> int:
+        """Remove a record from its list by moving the last record into its place; return its position."""
+        records, positions = getattr(self, collection), self._positions[collection]
+        position = positions.pop(id(record))
+        last = records.pop()
+        if last is not record:
+            records[position] = last
+            positions[id(last)] = position
+        return position
+    
+    def _put_back(self, collection: str, record: Dict, position: int):
+        """Undo _take_out: return the record to its position and the moved record to the end."""
+        records, positions = getattr(self, collection), self._positions[collection]
+        if position < len(records):
+            moved = records[position]
+            positions[id(moved)] = len(records)
+            records.append(moved)
+            records[position] = record
+        else:
+            records.append(record)
+        positions[id(record)] = position
+    
+    # Change notification methods
+    def subscribe(self, callback: Subscriber, collections: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """Call callback(event) with a ChangeEvent for every change to the given collections (default: all).
+        
+        Events are delivered after the change is applied and logged, once the
+        data lock is released, on the thread that made the change (changes
+        made by other processes arrive on the thread that caught up on them).
+        A batch delivers its events when it ends and drops them if it rolls
+        back. Returns a function that cancels the subscription.
+        """
+        subscription = (callback, frozenset(collections) if collections is not None else None)
+        with self._lock:
+            self._subscribers.append(subscription)
+        
+        def unsubscribe():
+            with self._lock:
+                if subscription in self._subscribers:
+                    self._subscribers.remove(subscription)
+        return unsubscribe
+    
+    def _notify(self, collection: str, kind: str, key: Optional[str] = None, record: Optional[Dict] = None):
+        """Queue a change event for the subscribers; the caller holds the data lock."""
+        if self._subscribers:
+            self._events.append(ChangeEvent(collection, kind, key, record))
+    
+    def _dispatch(self):
+        """Deliver the queued change events to the subscribers."""
+        with self._lock:
+            if not self._events:
+                return
+            events, self._events = self._events, []
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback, collections in subscribers:
+                if collections is None or event.collection in collections:
+                    callback(event)
+    
+    # Multi-process methods
+    @contextmanager
+    def _synced(self, collection: str):
+        """Hold the data lock and, in shared mode, the collection's inter-process lock.
+        
+        Change events queued meanwhile are delivered when the outermost
+        holder outside a batch lets go.
+        """
+        # The appends made meanwhile wait for their group-commit fsync after the locks are released
+        with self.group_commit.deferred(), self._lock:
+            self._local.depth = getattr(self._local, 'depth', 0) + 1
+            try:
+                if self.shared:
+                    with self.process_locks[collection]:
+                        yield
+                else:
+                    yield
+            finally:
+                self._local.depth -= 1
+        if not self._local.depth and not self._in_batch():
+            self._dispatch()
+    
+    @contextmanager
+    def _writing(self, collection: str):
+        """Hold the locks for a mutation of collection, after catching up on other processes' changes."""
+        if self.shared and self._in_batch():
+            # The batch keeps the process lock until its entries are written
+            if collection not in self._batch_locks:
+                self.process_locks[collection].acquire()
+                self._batch_locks.append(collection)
+                self._refresh(collection)
+            yield
+            return
+        with self._synced(collection):
+            self._refresh(collection)
+            yield
+    
+    def _release_batch_locks(self):
+        """Record what the batch wrote and release the process locks it held."""
+        while self._batch_locks:
+            collection = self._batch_locks.pop()
+            self._note_written(collection)
+            self.process_locks[collection].release()
+    
+    def _file_state(self, collection: str):
+        """Return what identifies a collection's files on disk right now."""
+        if collection == 'service_claims':
+            return self.claim_journal.state()
+        
+        def identity(path, *fields):
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                return None
+            return tuple(getattr(info, field) for field in fields)
+        
+        snapshot = next((path for path in self.snapshot_paths(collection) if os.path.exists(path)), None)
+        wal = self.wals[collection]
+        return (identity(snapshot, 'st_ino', 'st_size', 'st_mtime_ns') if snapshot else None,
+                identity(wal.sealed_path, 'st_ino', 'st_size'),
+                identity(wal.path, 'st_ino', 'st_size'))
+    
+    def _note_written(self, collection: str):
+        """Remember the file state this instance is now in sync with (shared mode)."""
+        if self.shared and collection in self._loaded:
+            self._seen[collection] = self._file_state(collection)
+    
+    def _check_for_changes(self, collection: str):
+        """Catch a loaded collection up on other processes' changes, at most every refresh_interval."""
+        now = time.monotonic()
+        if now - self._checked.get(collection, 0.0) < self.refresh_interval:
+            return
+        with self._synced(collection):
+            self._refresh(collection)
+            self._checked[collection] = now
+    
+    def refresh(self):
+        """Catch every loaded collection up on changes made by other processes now."""
+        for collection in list(self._loaded):
+            with self._synced(collection):
+                self._refresh(collection)
+                self._checked[collection] = time.monotonic()
+    
+    def _refresh(self, collection: str):
+        """Apply what other processes wrote to a collection since this instance last saw it.
+        
+        The caller holds the collection's process lock. Appended log lines or
+        claims are read from where this instance left off; a rewritten
+        snapshot or claim shard means the collection is reloaded.
+        """
+        if not self.shared or collection not in self._loaded:
+            return
+        if collection == 'service_claims':
+            self.claim_journal.refresh_manifest()
+        state, seen = self._file_state(collection), self._seen.get(collection)
+        if state == seen:
+            return
+        undo, self._undo = self._undo, None  # Other processes' changes are not rolled back
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+        try:
+            if collection == 'service_claims':
+                appended = self._appended_claims(seen, state)
+            else:
+                appended = self._appended_entries(collection, seen, state)
+            if appended is None:
+                self.reload(collection)
+            elif collection == 'service_claims':
+                for claim in appended:
+                    self.service_claims.append(Claim(claim))
+                    self._index_claim(len(self.service_claims) - 1, self.service_claims[-1])
+                    self._notify('service_claims', ADDED, claim.get('Claim ID'), self.service_claims[-1])
+            else:
+                for entry in appended:
+                    self._apply_external(collection, entry)
+                if collection == 'users' and appended:
+                    self.rebuild_user_index()
+        finally:
+            self._local.depth -= 1
+            self._undo = undo
+        self._seen[collection] = self._file_state(collection)
+    
+    def reload(self, collection: str):
+        """Re-read a collection from disk, dropping what is held in memory."""
+        with self._synced(collection):
+            if collection == 'service_claims':
+                self.claim_journal.close()
+            else:
+                self.wals[collection].close()  # The log may have been replaced by a compaction
+            setattr(self, collection, getattr(self, f"load_{collection}")())
+            self._note_written(collection)
+    
+    def _appended_entries(self, collection: str, seen, state) -> Optional[List[Dict]]:
+        """Return the log entries appended since seen, or None if the collection must be reloaded."""
+        if seen is None or state[:2] != seen[:2]:
+            return None  # Compacted or rewritten by another process
+        wal_seen, wal_now = seen[2], state[2]
+        if wal_seen is None:
+            return self.wals[collection].read_from(0)
+        if wal_now is None or wal_now[0] != wal_seen[0] or wal_now[1] < wal_seen[1]:
+            return None
+        return self.wals[collection].read_from(wal_seen[1])
+    
+    def _appended_claims(self, seen, state) -> Optional[List[Dict]]:
+        """Return the claims appended to the shards since seen, or None if they must be reloaded."""
+        if seen is None or any(path not in state for path in seen):
+            return None
+        claims = []
+        for path, (inode, size) in state.items():
+            previous = seen.get(path)
+            if previous is None:
+                claims += JsonLinesJournal(path).read_from(0)
+            elif previous[0] != inode or size < previous[1]:
+                return None  # Rewritten by another process
+            elif size > previous[1]:
+                claims += JsonLinesJournal(path).read_from(previous[1])
+        return claims
+    
+    def _apply_external(self, collection: str, entry: Dict):
+        """Apply another process's log entry to memory, keeping the indexes consistent."""
+        if collection == 'users':
+            existed = entry['key'] in self._users
+            apply_mutation(self._users, entry)
+            kind = DELETED if entry['op'] == 'delete' else UPDATED if existed else ADDED
+            self._notify('users', kind, entry['key'], self._users.get(entry['key']))
+            return
+        op, key = entry['op'], entry['key']
+        record = self._by_key[collection].get(key)
+        if op in ('add', 'delete') and record is not None:
+            self._remove_record(collection, record)
+        if op == 'add':
+            self._add_record(collection, entry['data'])
+        elif op != 'delete' and record is not None:
+            self._update_record(collection, record, entry.get('data') or {})
+    
+    # Batch methods
+    def _in_batch(self) -> bool:
+        """Check whether the calling thread has a batch open."""
+        return self._batch_depth > 0 and self._batch_owner == threading.get_ident()
+    
+    @contextmanager
+    def batch(self):
+        """Group mutations so every changed file is written once, when the block exits.
+        
+        Inside ``with data_manager.batch():`` changes apply to memory at once,
+        but their log entries are buffered and appended with one write per
+        changed file on exit. If the block raises, the in-memory state is
+        rolled back and nothing is written. The batch holds the data lock, so
+        other threads wait until it ends; nested batches join the outer one.
+        """
+        with self.group_commit.deferred(), self._lock:
+            if self._in_batch():
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                return
+            self._batch_depth = 1
+            self._batch_owner = threading.get_ident()
+            self._undo = []
+            first_event = len(self._events)
+            try:
+                yield self
+            except BaseException:
+                self._rollback()
+                self._end_batch()
+                self._release_batch_locks()
+                del self._events[first_event:]  # The changes never happened
+                raise
+            entries, claims, snapshots = self._end_batch()
+            if self._flusher is not None and not self.shared:
+                self._queue(entries, claims, snapshots)
+                entries, snapshots = {}, set()  # Written by the flusher
+            else:
+                try:
+                    for collection, collection_entries in entries.items():
+                        self.wals[collection].append_many(collection_entries)
+                    if claims:
+                        self.claim_journal.append_many(claims)
+                finally:
+                    self._release_batch_locks()
+        if not getattr(self._local, 'depth', 0):
+            self._dispatch()
+        # Snapshots asked for inside the batch are written after the lock is released
+        for collection in snapshots:
+            self.write_snapshot(collection)
+        for collection in entries:
+            if collection not in snapshots:
+                self._check_compaction(collection)
+    
+    def _end_batch(self):
+        """Close the current batch and return its buffered entries, claims and snapshots."""
+        pending = (self._batch_entries, self._batch_claims, self._batch_snapshots)
+        self._batch_depth = 0
+        self._batch_owner = None
+        self._batch_entries, self._batch_claims, self._batch_snapshots = {}, [], set()
+        self._undo = None
+        return pending
+    
+    def _rollback(self):
+        """Undo every in-memory change made in the current batch, newest first."""
+        for action in reversed(self._undo):
+            kind, collection = action[0], action[1]
+            if kind == 'add':
+                record = action[2]
+                self._unindex_record(collection, record)
+                self._take_out(collection, record)
+            elif kind == 'update':
+                record, previous = action[2], action[3]
+                self._unindex_record(collection, record)
+                for field, value in previous.items():
+                    if value is _MISSING:
+                        record.pop(field, None)
+                    else:
+                        record[field] = value
+                self._index_record(collection, record)
+            elif kind == 'remove':
+                record, position = action[2], action[3]
+                self._put_back(collection, record, position)
+                self._index_record(collection, record)
+            elif kind == 'user_add':
+                user = self.users.pop(action[2])
+                self._user_keys.pop(user['username'], None)
+            elif kind == 'user_delete':
+                key, user = action[2], action[3]
+                self.users[key] = user
+                self._user_keys[user['username']] = key
+            elif kind == 'claim_add':
+                claim = self.service_claims.pop()
+                self._unindex_claim(len(self.service_claims), claim)
+    
+    # Write-ahead log and snapshot methods
+    def log_mutation(self, collection: str, op: str, key: str, data: Optional[Dict] = None):
+        """Record a mutation in the collection's write-ahead log."""
+        entry = MutationLog.make_entry(op, key, dict(data) if data is not None else None)
+        if self._in_batch():
+            self._batch_entries.setdefault(collection, []).append(entry)
+        elif self._flusher is not None and not self.shared:
+            self._queue({collection: [entry]})
+        else:
+            self.wals[collection].append(entry)
+            self._note_written(collection)
+            self._check_compaction(collection)
+    
+    def _check_compaction(self, collection: str):
+        """Compact a collection once its log passes the size threshold."""
+        if self.wals[collection].size() < self.compact_threshold:
+            return
+        if self._compactor is not None:
+            self._compact_requested.set()
+        elif self._compact_lock.acquire(blocking=False):
+            # Non-blocking so a caller holding the data lock never waits on a
+            # compaction that is itself waiting for the data lock
+            try:
+                self._write_snapshot_locked(collection)
+            finally:
+                self._compact_lock.release()
+    
+    def replay_wal(self, collection: str, snapshot):
+        """Apply the logged mutations of a collection on top of its snapshot."""
+        key_field = SNAPSHOT_COLLECTIONS[collection]
+        records = snapshot if key_field is None else None
+        for entry in self.wals[collection].entries():
+            if records is None:
+                records = {record[key_field]: record for record in snapshot}
+            apply_mutation(records, entry)
+        if records is None:
+            return snapshot  # Nothing logged since the snapshot
+        return records if key_field is None else list(records.values())
+    
+    def _copy_collection(self, collection: str):
+        """Copy a collection so it can be serialized without holding the lock."""
+        data = getattr(self, collection)
+        if isinstance(data, dict):
+            return {key: dict(value) for key, value in data.items()}
+        return [dict(record) for record in data]
+    
+    def _save(self, collection: str):
+        """Snapshot a collection now, or mark it dirty for the flusher in write-behind mode."""
+        if self._flusher is not None and not self._in_batch():
+            self._queue(snapshots={collection})
+        else:
+            self.write_snapshot(collection)
+    
+    def write_snapshot(self, collection: str):
+        """Write a fresh snapshot of a collection and fold its log into it."""
+        if self._in_batch():
+            self._batch_snapshots.add(collection)  # Written once when the batch exits
+            return
+        with self._compact_lock:
+            self._write_snapshot_locked(collection)
+    
+    def _write_snapshot_locked(self, collection: str):
+        """Write a snapshot; the caller holds the compaction lock."""
+        if collection == 'service_claims':
+            # Claims are appended under the data lock, so rewrite under it too
+            with self._synced(collection):
+                self._refresh(collection)
+                with self._flush_cond:
+                    queued, self._pending_claims = self._pending_claims, []  # Written by the rewrite
+                try:
+                    self.claim_journal.rewrite([dict(claim) for claim in self.service_claims])
+                except BaseException:
+                    with self._flush_cond:
+                        self._pending_claims[:0] = queued
+                    raise
+                self._note_written(collection)
+            return
+        with self._synced(collection):
+            self._refresh(collection)
+            data = self._copy_collection(collection)
+            self.wals[collection].seal()
+            if self.shared:
+                # Other processes must not append or reload until the snapshot is replaced
+                self._replace_snapshot(collection, data)
+                return
+        self._replace_snapshot(collection, data)
+    
+    def _replace_snapshot(self, collection: str, data):
+        """Write a collection's new snapshot and retire the log segment sealed into it."""
+        wal = self.wals[collection]
+        path = self.snapshot_path(collection)
+        write_file(path, data, self.codecs[collection])
+        # Drop a copy left in the previous format so it can't be read later
+        for other in self.snapshot_paths(collection):
+            if other != path and os.path.exists(other):
+                os.remove(other)
+        if collection == 'members' and self.use_member_store:
+            self._build_member_store(data, os.stat(path))
+        if self.archive_wal:
+            wal.archive_sealed(self.wal_archive_dir)
+            if self.wal_archive_age is not None:
+                self._expire_wal_archive(wal)
+        else:
+            wal.discard_sealed()
+        self._note_written(collection)
+    
+    def snapshot_path(self, collection: str, codec_name: Optional[str] = None) -> str:
+        """Return the snapshot file of a collection for a codec (default: its configured one)."""
+        codec = get_codec(codec_name) if codec_name else self.codecs[collection]
+        return os.path.splitext(self.snapshot_files[collection])[0] + codec.extension
+    
+    def snapshot_paths(self, collection: str) -> List[str]:
+        """Return every file name a collection's snapshot can have, configured format first."""
+        paths = [self.snapshot_path(collection)]
+        for name in CODECS:
+            path = self.snapshot_path(collection, name)
+            if path not in paths:
+                paths.append(path)
+        return paths
+    
+    def read_snapshot(self, collection: str, default):
+        """Read a collection's snapshot in whatever format it was saved, or return default."""
+        for path in self.snapshot_paths(collection):
+            if os.path.exists(path):
+                return read_file(path)
+        return default
+    
+    def convert_snapshot(self, collection: str, codec_name: str):
+        """Switch a collection to another codec and rewrite its snapshot in that format."""
+        self.codecs[collection] = get_codec(codec_name)
+        self.write_snapshot(collection)
+    
+    def compact(self, collections: Optional[Iterable[str]] = None):
+        """Fold every non-empty write-ahead log into its snapshot file.
+        
+        By default only loaded collections are compacted; the log of one that
+        was never loaded is simply replayed when it is next read.
+        """
+        if collections is None:
+            collections = [name for name in SNAPSHOT_COLLECTIONS if name in self._loaded]
+        for collection in collections:
+            if self.wals[collection].pending_size():
+                self.write_snapshot(collection)
+    
+    def _compaction_loop(self):
+        """Background compactor: runs when a log passes the size threshold or the interval elapses."""
+        while not self._closed.is_set():
+            self._compact_requested.wait(self.compact_interval)
+            self._compact_requested.clear()
+            if self._closed.is_set():
+                break
+            try:
+                self.compact()
+                self.claim_journal.seal_old_shards()
+            except OSError:
+                pass  # The log still holds every change; retry on the next cycle
+    
+    def sync(self):
+        """Block until every logged change is fsynced to disk."""
+        self.group_commit.flush()
+    
+    # Write-behind methods
+    def _queue(self, entries: Optional[Dict[str, List[Dict]]] = None, claims: Optional[List[Dict]] = None,
+               snapshots: Iterable[str] = ()):
+        """Hand log entries, claims and dirty collections to the background flusher."""
+        with self._flush_cond:
+            for collection, collection_entries in (entries or {}).items():
+                self._pending_entries.setdefault(collection, []).extend(collection_entries)
+            self._pending_claims.extend(claims or ())
+            self._dirty.update(snapshots)
+            now = time.monotonic()
+            if self._first_change is None:
+                self._first_change = now
+            self._last_change = now
+            self._flush_cond.notify()
+    
+    def _flush_loop(self):
+        """Background flusher: writes queued changes once they stop arriving for the debounce interval."""
+        while True:
+            with self._flush_cond:
+                while self._first_change is None and not self._closed.is_set():
+                    self._flush_cond.wait()
+                if self._closed.is_set():
+                    return  # close() flushes whatever is left
+                # Each new change restarts the wait, but nothing is held back
+                # for longer than ten intervals
+                while self._first_change is not None and not self._closed.is_set():
+                    deadline = min(self._last_change + self.write_behind,
+                                   self._first_change + 10 * self.write_behind)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._flush_cond.wait(remaining)
+            try:
+                self._flush_pending()
+            except OSError:
+                self._closed.wait(max(self.write_behind, 1.0))  # Still queued; retry later
+    
+    def _flush_pending(self):
+        """Write every queued log entry, claim and dirty snapshot."""
+        with self.group_commit.deferred(), self._flush_io_lock:
+            # Take the queue and copy the claims together, so a claim is
+            # either in the rewritten journal or still queued, never both
+            with self._lock, self._flush_cond:
+                entries, claims, dirty = self._pending_entries, self._pending_claims, self._dirty
+                self._pending_entries, self._pending_claims, self._dirty = {}, [], set()
+                self._first_change = self._last_change = None
+                written = list(entries)
+                claim_copy = None
+                if 'service_claims' in dirty and not self.shared:
+                    claim_copy = [dict(claim) for claim in self.service_claims]
+                    claims = []
+            try:
+                while entries:
+                    collection = next(iter(entries))
+                    self.wals[collection].append_many(entries[collection])
+                    del entries[collection]
+                if claims:
+                    self.claim_journal.append_many(claims)
+                    claims = []
+                if claim_copy is not None:
+                    self.claim_journal.rewrite(claim_copy)
+                    dirty.discard('service_claims')
+                for collection in list(dirty):
+                    self.write_snapshot(collection)
+                    dirty.discard(collection)
+            except BaseException:
+                # Put back whatever was not written, ahead of anything queued since
+                with self._flush_cond:
+                    for collection, collection_entries in entries.items():
+                        self._pending_entries[collection] = (
+                            collection_entries + self._pending_entries.get(collection, []))
+                    self._pending_claims[:0] = claims
+                    self._dirty |= dirty
+                    if self._first_change is None:
+                        self._first_change = self._last_change = time.monotonic()
+                raise
+        for collection in written:
+            self._check_compaction(collection)
+    
+    def flush(self):
+        """Write every change still queued by write-behind mode and wait until it is on disk."""
+        if self._in_batch():
+            raise RuntimeError("flush() cannot be called inside a batch")
+        self._flush_pending()
+        self.sync()
+    
+    def close(self):
+        """Stop the background threads, flush and compact the logs and close open files."""
+        self._closed.set()
+        self._compact_requested.set()
+        if self._compactor is not None:
+            self._compactor.join()
+        for thread in self._backup_threads:
+            thread.join()
+        if self._flusher is not None:
+            with self._flush_cond:
+                self._flush_cond.notify_all()
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+        self.compact()
+        for wal in self.wals.values():
+            wal.close()
+        self.claim_journal.close()
+        if self._member_store is not None:
+            self._member_store.close()
+            self._member_store = None
+    
+    # User management methods
+    def load_users(self) -> Dict:
+        """Load users from the snapshot and replay the users log."""
+        users = {}
+        try:
+            users = self.read_snapshot('users', users)
+            return self.replay_wal('users', users)
+        except (json.JSONDecodeError, CodecError, FileNotFoundError):
+            pass
+        return users
+    
+    def save_users(self):
+        """Save users to JSON file."""
+        # The users dict may have been edited directly, so refresh its index first
+        with self._lock:
+            self.rebuild_user_index()
+        self._save('users')
+    
+    def add_user(self, username: str, password: str, role: str) -> bool:
+        """Add a new user."""
+        with self._writing('users'):
+            if username in self.users or username in self._user_keys:
+                return False  # User already exists
+            
+            self.users[username] = {
+                'username': username,
+                'password': password,
+                'role': role
+            }
+            self._user_keys[username] = username
+            if self._undo is not None:
+                self._undo.append(('user_add', 'users', username))
+            self._notify('users', ADDED, username, self.users[username])
+            self.log_mutation('users', 'add', username, self.users[username])
+        return True
+    
+    def get_user(self, username: str) -> Optional[Dict]:
+        """Get a user by username (case-sensitive)."""
+        self._ensure_loaded('users')
+        key = self._user_keys.get(username)
+        return self.users.get(key) if key is not None else None
+    
+    def delete_user(self, username: str) -> bool:
+        """Delete a user account."""
+        self._ensure_loaded('users')
+        with self._writing('users'):
+            key = self._user_keys.pop(username, None)
+            if key is None:
+                return False
+            user = self.users.pop(key)
+            if self._undo is not None:
+                self._undo.append(('user_delete', 'users', key, user))
+            self._notify('users', DELETED, key)
+            self.log_mutation('users', 'delete', key)
+        return True
+    
+    def authenticate_user(self, username: str, password: str, role: str) -> bool:
+        """Authenticate a user."""
+        user = self.get_user(username)
+        if user and user['password'] == password and user['role'] == role:
+            return True
+        return False
+    
+    # Member management methods
+    def load_members(self) -> List[Dict]:
+        """Load members from the snapshot and replay the members log."""
+        members = []
+        try:
+            members = self.read_snapshot('members', members)
+            return self.replay_wal('members', members)
+        except (json.JSONDecodeError, CodecError, FileNotFoundError):
+            pass
+        return members
+    
+    def save_members(self):
+        """Save members to JSON file."""
+        self._save('members')
+    
+    def add_member(self, name: str, address: str, city: str, state: str, zip_code: str) -> str:
+        """Add a new member and return the generated member ID."""
+        with self._writing('members'):
+            member_id = self.generate_member_id()
+            member = {
+                'member_id': member_id,
+                'name': name,
+                'address': address,
+                'city': city,
+                'state': state.upper(),
+                'zip': zip_code,
+                'status': 'Valid'
+            }
+            self._add_record('members', member)
+            self.log_mutation('members', 'add', member_id, member)
+        return member_id
+    
+    def get_member(self, member_id: str) -> Optional[Dict]:
+        """Get a member by ID."""
+        if self.use_member_store and 'members' not in self._loaded:
+            member = self._stored_member(member_id)
+            if member is not _MISSING:
+                return member
+        return self._keyed('members').get(member_id)
+    
+    def update_member(self, member_id: str, **kwargs) -> bool:
+        """Update member information."""
+        with self._writing('members'):
+            member = self._keyed('members').get(member_id)
+            if member:
+                self._update_record('members', member, kwargs)
+                self.log_mutation('members', 'update', member_id, kwargs)
+                return True
+        return False
+    
+    def delete_member(self, member_id: str) -> bool:
+        """Delete a member."""
+        with self._writing('members'):
+            member = self._keyed('members').get(member_id)
+            if member:
+                self._remove_record('members', member)
+                self.log_mutation('members', 'delete', member_id)
+                return True
+        return False
+    
+    def renew_member(self, member_id: str) -> bool:
+        """Renew an expired member."""
+        with self._writing('members'):
+            member = self._keyed('members').get(member_id)
+            if member and member['status'] == 'Expired':
+                self._update_record('members', member, {'status': 'Valid'})
+                self.log_mutation('members', 'renew', member_id, {'status': 'Valid'})
+                return True
+        return False
+    
+    def find_members(self, status: Optional[str] = None, state: Optional[str] = None,
+                     zip_code: Optional[str] = None) -> List[Dict]:
+        """Find members matching every given field, e.g. expired members in CA.
+        
+        Uses the status/state/zip indexes, so the cost follows the size of the
+        smallest matching group rather than the whole member list.
+        """
+        criteria = {'status': status, 'state': state.upper() if state else state, 'zip': zip_code}
+        self._ensure_loaded('members')
+        with self._lock:
+            keys = lookup(self._secondary['members'], criteria)
+            if keys is None:
+                return list(self.members)
+            members = self._by_key['members']
+            return [members[key] for key in keys]
+    
+    def complete_member_ids(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return up to limit member IDs starting with prefix, in order."""
+        return self._search_index('members', 'prefix').complete(prefix, limit)
+    
+    def search_members(self, query: str, limit: int = 20) -> List[Dict]:
+        """Find members by name or address, tolerating typos; best matches first.
+        
+        Uses the member trigram index (see TrigramIndex.similar), built the
+        first time members are searched and kept current afterwards.
+        """
+        members = self._keyed('members')
+        return [members[member_id] for member_id, _ in self._search_index('members', 'text').similar(query, limit)]
+    
+    # Fixed-width member store methods
+    def _build_member_store(self, members: List[Dict], source: os.stat_result):
+        """Write the member store for a members snapshot, or drop it if they don't fit."""
+        try:
+            build_member_store(self.member_store_file, members, source)
+        except ValueError:
+            # A field too long for its slot: lookups use the member list instead
+            if os.path.exists(self.member_store_file):
+                os.remove(self.member_store_file)
+    
+    def _open_member_store(self) -> Optional[MemberStore]:
+        """Return the mapped member store, rebuilding it if it is older than the members snapshot."""
+        snapshot = self.snapshot_path('members')
+        if not os.path.exists(snapshot):
+            # Saved in another format, or nothing saved yet
+            snapshot = next((path for path in self.snapshot_paths('members') if os.path.exists(path)), None)
+            if snapshot is None:
+                return None
+        source = os.stat(snapshot)
+        source_mark = (source.st_size, source.st_mtime_ns)
+        try:
+            stat = os.stat(self.member_store_file)
+            identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            identity = None
+        store = self._member_store
+        if store is not None and store.identity == identity and store.source == source_mark:
+            return store
+        if store is not None:
+            store.close()
+            self._member_store = None
+        try:
+            if identity is not None:
+                store = MemberStore(self.member_store_file)
+                if store.source == source_mark:
+                    self._member_store = store
+                    return store
+                store.close()
+            self._build_member_store(read_file(snapshot), source)
+            if os.path.exists(self.member_store_file):
+                self._member_store = MemberStore(self.member_store_file)
+        except (ValueError, OSError):
+            self._member_store = None
+        return self._member_store
+    
+    def _stored_member(self, member_id: str):
+        """Look a member up in the member store plus the members log (_MISSING if unavailable)."""
+        with self._lock:
+            store = self._open_member_store()
+            if store is None:
+                return _MISSING
+            overlay = self._member_log_overlay(store)
+            if member_id in overlay:
+                member = overlay[member_id]
+                return dict(member) if member is not None else None
+            return store.get(member_id)
+    
+    def _member_log_overlay(self, store: MemberStore) -> Dict[str, Optional[Dict]]:
+        """Replay the members log over the store: member ID -> current record (None if deleted)."""
+        wal = self.wals['members']
+        mark = (store.identity, wal.pending_size())
+        if mark == self._overlay_mark:
+            return self._member_overlay
+        overlay = {}
+        for entry in wal.entries():
+            op, key = entry['op'], entry['key']
+            if op == 'add':
+                overlay[key] = dict(entry['data'])
+            elif op == 'delete':
+                overlay[key] = None
+            else:
+                current = overlay[key] if key in overlay else store.get(key)
+                if current is not None:
+                    overlay[key] = {**current, **(entry.get('data') or {})}
+        self._member_overlay, self._overlay_mark = overlay, mark
+        return overlay
+    
+    # Provider management methods
+    def load_providers(self) -> List[Dict]:
+        """Load providers from the snapshot and replay the providers log."""
+        providers = []
+        try:
+            providers = self.read_snapshot('providers', providers)
+            return self.replay_wal('providers', providers)
+        except (json.JSONDecodeError, CodecError, FileNotFoundError):
+            pass
+        return providers
+    
+    def save_providers(self):
+        """Save providers to JSON file."""
+        self._save('providers')
+    
+    def add_provider(self, name: str, address: str, city: str, state: str, zip_code: str) -> str:
+        """Add a new provider and return the generated provider ID."""
+        with self._writing('providers'):
+            provider_id = self.generate_provider_id()
+            provider = {
+                'provider_id': provider_id,
+                'name': name,
+                'address': address,
+                'city': city,
+                'state': state.upper(),
+                'zip': zip_code
+            }
+            self._add_record('providers', provider)
+            self.log_mutation('providers', 'add', provider_id, provider)
+        
+        # Create a user account for the provider
+        username = provider_username(name)  # Create username from name
+        password = f"{provider_id}"  # Use provider ID as initial password
+        self.add_user(username, password, 'provider')
+        
+        return provider_id
+    
+    def get_provider(self, provider_id: str) -> Optional[Dict]:
+        """Get a provider by ID."""
+        return self._keyed('providers').get(provider_id)
+    
+    def get_provider_by_username(self, username: str) -> Optional[Dict]:
+        """Get a provider by username."""
+        user = self.get_user(username)
+        if user and user['role'] == 'provider':
+            # Usernames are derived from provider names, which the username index tracks
+            self._ensure_loaded('providers')
+            provider_id = self._secondary['providers']['username'].first(username)
+            return self.get_provider(provider_id) if provider_id else None
+        return None
+    
+    def update_provider(self, provider_id: str, **kwargs) -> bool:
+        """Update provider information."""
+        with self._writing('providers'):
+            provider = self.get_provider(provider_id)
+            if provider:
+                self._update_record('providers', provider, kwargs)
+                self.log_mutation('providers', 'update', provider_id, kwargs)
+                return True
+        return False
+    
+    def delete_provider(self, provider_id: str) -> bool:
+        """Delete a provider."""
+        with self._writing('providers'):
+            provider = self.get_provider(provider_id)
+            if provider:
+                self._remove_record('providers', provider)
+                self.log_mutation('providers', 'delete', provider_id)
+                return True
+        return False
+    
+    # Service claims management methods
+    def load_service_claims(self) -> List[Dict]:
+        """Stream service claims back in from the monthly claim shards."""
+        try:
+            if not self.claim_journal.exists():
+                self.migrate_legacy_service_claims()
+            self.claim_journal.seal_old_shards()
+            # Built as records while streaming, so no list of dicts is held
+            return [Claim(claim) for claim in self.claim_journal]
+        except (json.JSONDecodeError, FileNotFoundError):
+            pass
+        return []
+    
+    def migrate_legacy_service_claims(self):
+        """Split an older service_claims.jsonl journal or service_claims.json document into monthly shards."""
+        try:
+            if os.path.exists(self.service_claims_file):
+                source = self.service_claims_file
+                claims = list(JsonLinesJournal(source))
+            else:
+                source = self.legacy_service_claims_file
+                with open(source, 'r') as f:
+                    claims = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return
+        self.claim_journal.rewrite(claims)
+        os.replace(source, source + '.migrated')
+    
+    def save_service_claims(self):
+        """Rewrite the claim journal from the in-memory claim list."""
+        self._save('service_claims')
+    
+    def add_service_claim(self, member_id: str, date_of_service: str, provider_number: str, 
+                         service_code: str, comments: str = "") -> str:
+        """Add a new service claim and return the claim ID."""
+        # Get service information
+        service = self.get_service(service_code)
+        if not service:
+            raise ValueError(f"Service code {service_code} not found")
+        
+        claim_id = self.generate_claim_id()
+        current_datetime = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
+        
+        claim = Claim({
+            'Claim ID': claim_id,
+            'Current Date/Time': current_datetime,
+            'Date of Service': date_of_service,
+            'Provider Number': provider_number,
+            'Member ID': member_id,
+            'Service Code': service_code,
+            'Service Name': service['name'],
+            'Fee': service['fee'],
+            'Comments': comments,
+            'Status': 'Pending'
+        })
+        
+        if 'service_claims' not in self._loaded and not self._in_batch():
+            # No claim history in memory to index: append to the current
+            # month's shard only, and the claim is read with the rest on load
+            with self._synced('service_claims'):
+                if 'service_claims' not in self._loaded:
+                    self.claim_journal.append(claim)
+                    self._notify('service_claims', ADDED, claim_id, claim)
+                    return claim_id
+        with self._writing('service_claims'):
+            self.service_claims.append(claim)
+            self._index_claim(len(self.service_claims) - 1, claim)
+            self._notify('service_claims', ADDED, claim_id, claim)
+            if self._in_batch():
+                self._undo.append(('claim_add', 'service_claims'))
+                self._batch_claims.append(claim)
+            elif self._flusher is not None and not self.shared:
+                self._queue(claims=[claim])
+            else:
+                self.claim_journal.append(claim)
+                self._note_written('service_claims')
+        return claim_id
+    
+    def find_claims(self, member_id: Optional[str] = None, provider_number: Optional[str] = None,
+                    service_code: Optional[str] = None, start: Union[str, date, None] = None,
+                    end: Union[str, date, None] = None) -> List[Dict]:
+        """Find claims matching every given field and a date-of-service range.
+        
+        start and end are inclusive and may be MM-DD-YYYY strings or dates. With
+        a range the claims come back in date-of-service order, otherwise by
+        month of service and then in the order they were submitted. Only the
+        indexes are scanned, e.g. "all claims for provider X this week" never
+        walks the full claim history. While the claims are not loaded, a ranged
+        query reads just the monthly shards that overlap the range instead of
+        loading every claim.
+        """
+        criteria = {'Member ID': member_id, 'Provider Number': provider_number, 'Service Code': service_code}
+        if 'service_claims' not in self._loaded and (start is not None or end is not None):
+            return self._find_claims_in_shards(criteria, service_date_ordinal(start), service_date_ordinal(end))
+        self._ensure_loaded('service_claims')
+        with self._lock:
+            positions = lookup(self._claim_indexes, criteria)
+            if start is not None or end is not None:
+                low, high = service_date_ordinal(start), service_date_ordinal(end)
+                in_range = self._claim_dates.range(low, high)
+                if positions is None:
+                    positions = in_range
+                elif len(positions) < len(in_range):
+                    # Fewer field matches than dated claims: filter them by date instead
+                    dated = []
+                    for position in positions:
+                        ordinal = service_date_ordinal(self.service_claims[position].get('Date of Service'))
+                        if ordinal is not None and (low is None or ordinal >= low) and (high is None or ordinal <= high):
+                            dated.append((ordinal, position))
+                    positions = [position for _, position in sorted(dated)]
+                else:
+                    matches = set(positions)
+                    positions = [position for position in in_range if position in matches]
+            if positions is None:
+                return list(self.service_claims)
+            return [self.service_claims[position] for position in positions]
+    
+    def _find_claims_in_shards(self, criteria: Dict[str, Optional[str]], low: Optional[int],
+                               high: Optional[int]) -> List[Dict]:
+        """Answer a ranged find_claims by streaming only the shards overlapping the range."""
+        fields = [(field, value) for field, value in criteria.items() if value is not None]
+        dated = []
+        for claim in self.claim_journal.read_range(low, high):
+            ordinal = service_date_ordinal(claim.get('Date of Service'))
+            if ordinal is None or (low is not None and ordinal < low) or (high is not None and ordinal > high):
+                continue
+            if all(claim.get(field) == value for field, value in fields):
+                dated.append((ordinal, len(dated), Claim(claim)))
+        return [claim for _, _, claim in sorted(dated, key=lambda item: item[:2])]
+    
+    def iter_claims(self, start: Union[str, date], end: Union[str, date]) -> Iterator[Dict]:
+        """Stream the claims with a date of service in an inclusive range, in no particular order.
+
+        Unlike find_claims nothing is collected or sorted: while the claims are
+        not loaded the overlapping shards are read one claim at a time, so a
+        report over a busy week holds a single claim in memory. Both bounds
+        are required; a date that can't be parsed raises ValueError at once.
+        """
+        low, high = service_date_ordinal(start), service_date_ordinal(end)
+        for bound, ordinal in ((start, low), (end, high)):
+            if ordinal is None:
+                raise ValueError(f"Invalid date of service {bound!r}; expected MM-DD-YYYY")
+        return self._iter_claims(low, high)
+    
+    def _iter_claims(self, low: int, high: int) -> Iterator[Dict]:
+        """Yield the claims dated between two day ordinals, inclusive."""
+        if 'service_claims' not in self._loaded:
+            for claim in self.claim_journal.read_range(low, high):
+                ordinal = service_date_ordinal(claim.get('Date of Service'))
+                if ordinal is not None and low <= ordinal <= high:
+                    yield claim
+            return
+        with self._lock:
+            claims, positions = self.service_claims, self._claim_dates.range(low, high)
+        # Claims are only ever appended, so the positions stay valid outside the lock
+        for position in positions:
+            yield claims[position]
+    
+    # Service directory management methods
+    def load_service_directory(self) -> List[Dict]:
+        """Load service directory from the snapshot and replay the service directory log."""
+        service_directory = []
+        try:
+            service_directory = self.read_snapshot('service_directory', service_directory)
+            return self.replay_wal('service_directory', service_directory)
+        except (json.JSONDecodeError, CodecError, FileNotFoundError):
+            pass
+        return service_directory
+    
+    def save_service_directory(self):
+        """Save service directory to JSON file."""
+        self._save('service_directory')
+    
+    def get_service(self, service_code: str) -> Optional[Dict]:
+        """Get a service by code."""
+        return self._keyed('service_directory').get(service_code)
+    
+    def complete_service_codes(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return up to limit service codes starting with prefix, in order."""
+        return self._search_index('service_directory', 'prefix').complete(prefix, limit)
+    
+    def search_services(self, search_term: str, limit: Optional[int] = None) -> List[Dict]:
+        """Search services by code or name, best matches first.
+        
+        Uses the service trigram index: exact matches rank first, then code
+        or name prefixes, word starts and matches inside a word.
+        """
+        services = self._keyed('service_directory')
+        return [services[code] for code in self._search_index('service_directory', 'text').search(search_term, limit)]
+    
+    def add_service(self, code: str, name: str, fee: float) -> bool:
+        """Add a new service to the directory."""
+        with self._writing('service_directory'):
+            if self.get_service(code):
+                return False  # Service code already exists
+            
+            service = {
+                'code': code,
+                'name': name,
+                'fee': fee
+            }
+            self._add_record('service_directory', service)
+            self.log_mutation('service_directory', 'add', code, service)
+        return True
+    
+    def update_service(self, code: str, **kwargs) -> bool:
+        """Update service information."""
+        with self._writing('service_directory'):
+            service = self.get_service(code)
+            if service:
+                self._update_record('service_directory', service, kwargs)
+                self.log_mutation('service_directory', 'update', code, kwargs)
+                return True
+        return False
+    
+    def delete_service(self, code: str) -> bool:
+        """Delete a service from the directory."""
+        with self._writing('service_directory'):
+            service = self.get_service(code)
+            if service:
+                self._remove_record('service_directory', service)
+                self.log_mutation('service_directory', 'delete', code)
+                return True
+        return False
+    
+    # Utility methods
+    def get_expired_members(self) -> List[Dict]:
+        """Get all expired members."""
+        return self.find_members(status='Expired')
+    
+    def get_valid_members(self) -> List[Dict]:
+        """Get all valid members."""
+        return self.find_members(status='Valid')
+    
+    # Claim aggregates (one pass over typed columns, vectorized when NumPy is installed)
+    def _aggregate(self, start: Union[str, date, None], end: Union[str, date, None], query):
+        """Run query(columns, low, high) over the claim columns for an inclusive date range."""
+        self._ensure_loaded('service_claims')
+        low = service_date_ordinal(start) if start is not None else None
+        high = service_date_ordinal(end) if end is not None else None
+        with self._lock:
+            if not self._claim_columns:
+                return {}
+            return query(self._claim_columns, low, high)
+    
+    def fee_totals_by_provider(self, start: Union[str, date, None] = None,
+                               end: Union[str, date, None] = None) -> Dict[str, float]:
+        """Sum claim fees per provider number, optionally within a date-of-service range."""
+        return self._aggregate(start, end, lambda c, low, high: c.fee_totals_by(c.provider, low, high))
+    
+    def claim_counts_by_service_code(self, start: Union[str, date, None] = None,
+                                     end: Union[str, date, None] = None) -> Dict[str, int]:
+        """Count claims per service code, optionally within a date-of-service range."""
+        return self._aggregate(start, end, lambda c, low, high: c.counts_by(c.service_code, low, high))
+    
+    def claim_counts_per_week(self, start: Union[str, date, None] = None,
+                              end: Union[str, date, None] = None) -> Dict[date, int]:
+        """Count claims per week of service, keyed by the Monday that starts the week."""
+        return self._aggregate(start, end, lambda c, low, high: c.counts_per_week(low, high))
+    
+    def get_pending_claims(self) -> List[Dict]:
+        """Get all pending service claims."""
+        return [c for c in self.service_claims if c['Status'] == 'Pending']
+    
+    def get_approved_claims(self) -> List[Dict]:
+        """Get all approved service claims."""
+        return [c for c in self.service_claims if c['Status'] == 'Approved']
+    
+    def backup_files(self) -> List[str]:
+        """Return every data file a backup has to hold, including logs not yet compacted."""
+        files = [
+            self.service_claims_file,
+            self.legacy_service_claims_file,  # Older layouts not yet migrated into shards
+            self.sequences_file
+        ]
+        for collection, wal in self.wals.items():
+            files += self.snapshot_paths(collection) + [wal.sealed_path, wal.path]
+        return files + self.claim_journal.files()
+    
+    def backup_data(self, backup_dir: str = "backup", compression: Optional[str] = None,
+                    keep_daily: Optional[int] = None, keep_weekly: Optional[int] = None) -> str:
+        """Create an incremental backup of all data files and return its directory.
+        
+        Files unchanged since the previous backup are hard-linked from it and
+        the rest are streamed, compressed with 'gzip' or 'xz' if asked (see
+        backup.py). With keep_daily or keep_weekly set, older backups outside
+        that retention are deleted afterwards.
+        """
+        if not self._in_batch():
+            self.flush()
+        with self._backup_lock:
+            # No compaction while copying, so each snapshot is backed up with its own log
+            with self._compact_lock:
+                backup_path = create_backup(self.data_dir, self.backup_files(), backup_dir, compression)
+            if keep_daily is not None or keep_weekly is not None:
+                prune_backups(backup_dir, keep_daily or 0, keep_weekly or 0)
+            self.prune_wal_archive(backup_dir)
+            self.last_backup = backup_path
+        return backup_path
+    
+    def prune_wal_archive(self, backup_dir: str = "backup"):
+        """Delete archived log segments that hold only changes older than every backup."""
+        oldest = next((read_manifest(path) for path in list_backups(backup_dir) if read_manifest(path)), None)
+        if oldest is None:
+            return
+        cutoff = datetime.fromisoformat(oldest['created']).strftime('%Y%m%dT%H%M%S%f')
+        for wal in self.wals.values():
+            for segment in wal.archived_segments(self.wal_archive_dir):
+                # A segment is named after the time it was archived, after its last entry
+                if segment.rsplit('.', 1)[1] < cutoff:
+                    os.remove(segment)
+    
+    def _expire_wal_archive(self, wal: MutationLog):
+        """Delete a log's archived segments older than wal_archive_age."""
+        cutoff = (datetime.now() - timedelta(seconds=self.wal_archive_age)).strftime('%Y%m%dT%H%M%S%f')
+        expired = [segment for segment in wal.archived_segments(self.wal_archive_dir)
+                   if segment.rsplit('.', 1)[1] < cutoff]
+        if not expired:
+            return
+        # Recorded before deleting, so restore never rolls a backup forward across a gap
+        marker = os.path.join(self.wal_archive_dir, WAL_ARCHIVE_PRUNED)
+        try:
+            with open(marker, 'r', encoding='utf-8') as f:
+                pruned_through = f.read().strip()
+        except FileNotFoundError:
+            pruned_through = ''
+        newest = expired[-1].rsplit('.', 1)[1]
+        if newest > pruned_through:
+            with open(marker, 'w', encoding='utf-8') as f:
+                f.write(newest)
+                f.flush()
+                os.fsync(f.fileno())
+        for segment in expired:
+            os.remove(segment)
+    
+    def start_backup(self, backup_dir: str = "backup", **options) -> threading.Thread:
+        """Run backup_data on a background thread; last_backup holds the result once it finishes."""
+        thread = threading.Thread(target=self.backup_data, args=(backup_dir,), kwargs=options,
+                                  name="backup", daemon=True)
+        self._backup_threads = [t for t in self._backup_threads if t.is_alive()] + [thread]
+        thread.start()
+        return thread
+    
+    def schedule_backups(self, interval: float = 86400, backup_dir: str = "backup", **options) -> threading.Thread:
+        """Back up every interval seconds on a background thread until close()."""
+        def run():
+            while not self._closed.wait(interval):
+                try:
+                    self.backup_data(backup_dir, **options)
+                except OSError:
+                    pass  # Try again at the next interval
+        
+        thread = threading.Thread(target=run, name="backup-scheduler", daemon=True)
+        self._backup_threads.append(thread)
+        thread.start()
+        return thread
+
+
+def open_data_manager(data_dir="data", backend=None, **options) -> DataManager:
+    """Create a data manager for the configured storage backend.
+
+    The backend is "json" (default) or "sqlite"; when not given it is read from
+    the CHOCAN_BACKEND environment variable. Extra options are passed to the
+    JSON DataManager.
+    """
+    backend = backend or os.environ.get("CHOCAN_BACKEND", "json")
+    if backend == "sqlite":
+        from sqlite_store import SQLiteDataManager
+        return SQLiteDataManager(data_dir)
+    if backend != "json":
+        raise ValueError(f"Unknown storage backend: {backend}")
+    return DataManager(data_dir, **options)
@@ -0,0 +1,77 @@
+import json
+import random
+import threading
+from typing import Container, Dict
+
+from journal import atomic_write, file_lock
+
+
+def allocate_random_id(taken: Container[str], low: int = 100000000, high: int = 999999999) -> str:
+    """Pick a random ID in [low, high] that is not in taken.
+
+    taken should be a set or dict so each attempt is a constant-time check.
+    Even with a million IDs issued, fewer than 0.2% of attempts collide.
+    """
+    while True:
+        candidate = str(random.randint(low, high))
+        if candidate not in taken:
+            return candidate
+
+
+class SequenceAllocator:
+    """Monotonic, persisted ID sequence that hands out IDs in reserved blocks.
+
+    The next unreserved value of every named sequence is stored in one JSON
+    file. A process reserves block_size values at a time under an exclusive
+    file lock and then issues them from memory, so several processes can
+    assign IDs concurrently while only coordinating once per block. Values
+    are never reissued, even after records are deleted; a process that exits
+    leaves a gap for the unused part of its block.
+    """
+
+    def __init__(self, path: str, name: str, start: int = 1, block_size: int = 64):
+        self.path = path
+        self.lock_path = path + '.lock'
+        self.name = name
+        self.start = start
+        self.block_size = block_size
+        self._next = 0
+        self._limit = 0
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, int]:
+        """Read the persisted sequence counters."""
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def reserve(self, count: int, floor: int = 0) -> range:
+        """Reserve count consecutive values for this process.
+
+        floor only seeds a sequence that has no stored value yet, e.g. to start
+        above IDs issued before the sequence file existed; once stored, the
+        sequence alone decides.
+        """
+        with file_lock(self.lock_path):
+            sequences = self._read()
+            first = sequences.get(self.name)
+            if first is None:
+                first = max(self.start, floor)
+            sequences[self.name] = first + count
+            atomic_write(self.path, lambda f: json.dump(sequences, f, indent=2))
+        return range(first, first + count)
+
+    def next(self, floor: int = 0) -> int:
+        """Return the next value, reserving a new block when the current one is used up.
+
+        floor seeds the sequence if it has none stored yet (see reserve()).
+        """
+        with self._lock:
+            if self._next >= self._limit:
+                block = self.reserve(self.block_size, floor)
+                self._next, self._limit = block.start, block.stop
+            value = self._next
+            self._next += 1
+            return value
@@ -0,0 +1,347 @@
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: similar() then counts trigrams with a Counter
+    np = None
+
+# Runs of letters and digits; search text is split into words on everything else
+WORD = re.compile(r'[^\W_]+')
+
+
+class HashIndex:
+    """Secondary index mapping each value of one field to the keys of its records.
+
+    Keys are kept in insertion-ordered dicts used as ordered sets, so lookups
+    return keys in the order the records were indexed. An optional derive
+    function indexes a value computed from the record instead of a stored field.
+    """
+
+    def __init__(self, field: str, derive: Optional[Callable[[Dict], Hashable]] = None):
+        self.field = field
+        self.derive = derive
+        self._buckets: Dict[Hashable, Dict[str, None]] = {}
+
+    def value_of(self, record: Dict):
+        """Return the value a record is indexed under."""
+        return self.derive(record) if self.derive else record.get(self.field)
+
+    def clear(self):
+        """Drop every entry."""
+        self._buckets.clear()
+
+    def add(self, key: str, record: Dict):
+        """Index a record under its current field value."""
+        self._buckets.setdefault(self.value_of(record), {})[key] = None
+
+    def remove(self, key: str, record: Dict):
+        """Remove a record indexed under its current field value."""
+        value = self.value_of(record)
+        bucket = self._buckets.get(value)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[value]
+
+    def keys(self, value) -> Dict[str, None]:
+        """Return the keys of the records whose field equals value."""
+        return self._buckets.get(value, {})
+
+    def first(self, value) -> Optional[str]:
+        """Return the earliest indexed key with the given value, if any."""
+        return next(iter(self._buckets.get(value, ())), None)
+
+    def count(self, value) -> int:
+        """Return how many records have the given field value."""
+        return len(self._buckets.get(value, ()))
+
+    def values(self) -> List:
+        """Return the distinct field values currently indexed."""
+        return list(self._buckets)
+
+
+def intersect(key_sets: Iterable[Dict[str, None]]) -> List[str]:
+    """Intersect ordered key sets, walking only the smallest one."""
+    key_sets = sorted(key_sets, key=len)
+    if not key_sets:
+        return []
+    smallest, others = key_sets[0], key_sets[1:]
+    return [key for key in smallest if all(key in other for other in others)]
+
+
+def lookup(indexes: Dict[str, HashIndex], criteria: Dict[str, Optional[str]]) -> Optional[List[str]]:
+    """Return the keys matching every non-None criterion, or None if there are none."""
+    key_sets = [indexes[field].keys(value) for field, value in criteria.items() if value is not None]
+    if not key_sets:
+        return None
+    return intersect(key_sets)
+
+
+class SortedIndex:
+    """Ordered index over a sortable value (e.g. a date ordinal) for range scans.
+
+    Values and keys live in two parallel lists kept sorted by value. Records
+    that arrive roughly in order (like claims by date of service) are inserted
+    at or near the end, so maintenance stays cheap; a full rebuild goes
+    through bulk_load, which sorts once whatever the arrival order.
+    """
+
+    def __init__(self):
+        self._values: List = []
+        self._keys: List = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self):
+        """Drop every entry."""
+        self._values.clear()
+        self._keys.clear()
+
+    def bulk_load(self, pairs: Iterable[Tuple]):
+        """Replace the contents with (value, key) pairs, sorted by value then key."""
+        pairs = sorted(pairs)
+        self._values = [value for value, _ in pairs]
+        self._keys = [key for _, key in pairs]
+
+    def add(self, value, key):
+        """Insert key under value, after any existing keys with the same value."""
+        position = bisect_right(self._values, value)
+        self._values.insert(position, value)
+        self._keys.insert(position, key)
+
+    def remove(self, value, key):
+        """Remove key from under value, if present."""
+        position = bisect_left(self._values, value)
+        while position < len(self._values) and self._values[position] == value:
+            if self._keys[position] == key:
+                del self._values[position]
+                del self._keys[position]
+                return
+            position += 1
+
+    def range(self, low=None, high=None) -> List:
+        """Return the keys whose value lies in [low, high], in value order."""
+        start = 0 if low is None else bisect_left(self._values, low)
+        end = len(self._values) if high is None else bisect_right(self._values, high)
+        return self._keys[start:end]
+
+
+class PrefixIndex:
+    """Record keys (IDs, codes) kept in one sorted list for prefix completion.
+
+    Completing a prefix is two binary searches plus a slice of at most limit
+    keys, so it costs the same however many keys there are. It is maintained
+    like a HashIndex; each insert or removal shifts the tail of the list,
+    which for a list of pointers is a fast memmove.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._keys: List[str] = sorted(keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self):
+        """Drop every entry."""
+        self._keys.clear()
+
+    def add(self, key: str, record: Optional[Dict] = None):
+        """Insert a key unless it is already present."""
+        position = bisect_left(self._keys, key)
+        if position == len(self._keys) or self._keys[position] != key:
+            self._keys.insert(position, key)
+
+    def remove(self, key: str, record: Optional[Dict] = None):
+        """Remove a key, if present."""
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def complete(self, prefix: str, limit: Optional[int] = 10) -> List[str]:
+        """Return up to limit keys starting with prefix, in sorted order."""
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + '\U0010ffff', start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return self._keys[start:end]
+
+
+def trigrams(word: str) -> Set[str]:
+    """Return the three-character substrings of a word."""
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+def word_trigrams(text: str) -> Set[str]:
+    """Return the trigrams of every word of a lower-cased text, each word padded as "  word "."""
+    return {padded[i:i + 3] for padded in (f"  {word} " for word in WORD.findall(text))
+            for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Inverted trigram index over text fields, for substring and fuzzy search.
+
+    The lower-cased fields of each record are split into words, each word
+    padded as "  word " and cut into trigrams; every trigram maps to a typed
+    array of the integer IDs of the records containing it. IDs are handed out
+    in indexing order, so every posting array is sorted. Removing a record
+    only marks its ID dead (an update is a removal plus a new ID); the
+    postings are rebuilt once dead IDs outnumber live ones.
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def clear(self):
+        """Drop every entry."""
+        self._postings: Dict[str, array] = {}
+        self._ids: Dict[str, int] = {}
+        self._keys: List[Optional[str]] = []
+        self._texts: List[Optional[Tuple[str, ...]]] = []
+        self._sizes = array('H')  # Distinct trigrams of each ID
+        self._dead = 0
+
+    def texts_of(self, record: Dict) -> Tuple[str, ...]:
+        """Return the lower-cased text of each indexed field of a record."""
+        return tuple(str(record.get(field) or '').lower() for field in self.fields)
+
+    def add(self, key: str, record: Dict):
+        """Index a record under its current field values."""
+        if key in self._ids:
+            self.remove(key, record)
+        self._add_texts(key, self.texts_of(record))
+
+    def _add_texts(self, key: str, texts: Tuple[str, ...]):
+        doc = len(self._keys)
+        self._ids[key] = doc
+        self._keys.append(key)
+        self._texts.append(texts)
+        postings = self._postings
+        grams = word_trigrams(' '.join(texts))
+        self._sizes.append(min(len(grams), 0xFFFF))
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array('I')
+            posting.append(doc)
+
+    def remove(self, key: str, record: Optional[Dict] = None):
+        """Remove a record from the index."""
+        doc = self._ids.pop(key, None)
+        if doc is None:
+            return
+        self._keys[doc] = None
+        self._texts[doc] = None
+        self._dead += 1
+        if self._dead > 1024 and self._dead > len(self._ids):
+            self._compact()
+
+    def _compact(self):
+        """Rebuild the postings without the dead IDs."""
+        live = [(key, texts) for key, texts in zip(self._keys, self._texts) if key is not None]
+        self.clear()
+        for key, texts in live:
+            self._add_texts(key, texts)
+
+    @staticmethod
+    def _rank(query: str, texts: Tuple[str, ...]) -> Optional[int]:
+        """Rank how well query matches: 0 a whole field, 1 a field's start, 2 a word's start, 3 inside a word."""
+        best = None
+        for text in texts:
+            if text == query:
+                return 0
+            position = text.find(query)
+            while position > 0 and text[position - 1].isalnum():
+                position = text.find(query, position + 1)
+            if position == 0:
+                best = 1
+            elif position > 0:
+                best = 2 if best is None else min(best, 2)
+            elif best is None and query in text:
+                best = 3
+        return best
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Return the keys of the records with query in one of their fields, best matches first.
+
+        Whole-field matches come first, then field prefixes, word starts and
+        matches inside a word; ties keep indexing order. Candidates are read
+        from the shortest posting among the query's trigrams (every record
+        containing the query contains all of them) and then checked; a query
+        with no word of three characters checks every record.
+        """
+        query = query.lower()
+        grams = set()
+        for word in WORD.findall(query):
+            grams |= trigrams(word)
+        if grams:
+            postings = [self._postings.get(gram) for gram in grams]
+            if any(posting is None for posting in postings):
+                return []
+            candidates = min(postings, key=len)
+        else:
+            candidates = range(len(self._keys))
+        ranked = []
+        for doc in candidates:
+            texts = self._texts[doc]
+            if texts is not None:
+                rank = self._rank(query, texts)
+                if rank is not None:
+                    ranked.append((rank, doc))
+        ranked.sort()
+        return [self._keys[doc] for _, doc in ranked[:limit]]
+
+    def similar(self, query: str, limit: int = 10, threshold: float = 0.3) -> List[Tuple[str, float]]:
+        """Return up to limit (key, score) pairs for the records most like query, best first.
+
+        Candidates are the records having at least threshold of the query's
+        word trigrams, so misspelt or partial words still match. Counting
+        shared trigrams is one pass over the query's posting arrays,
+        vectorized with NumPy when it is installed. The best few candidates
+        by that share (ties to fewer trigrams, then indexing order) are then
+        re-ranked: the score averages the share with the closest
+        difflib ratio between query and a field, so "jhon smiht" prefers
+        John Smith over a Johnson living on Smith Ave.
+        """
+        query = query.lower()
+        pool = max(4 * limit, 40)
+        grams = word_trigrams(query)
+        postings = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not postings:
+            return []
+        needed = max(1, math.ceil(threshold * len(grams)))
+        if np is not None:
+            counts = np.bincount(np.concatenate([np.frombuffer(posting, dtype=np.uint32) for posting in postings]),
+                                 minlength=len(self._keys))
+            docs = np.flatnonzero(counts >= needed)
+            order = np.lexsort((docs, np.frombuffer(self._sizes, dtype=np.uint16)[docs], -counts[docs]))
+            best = []
+            for doc in docs[order].tolist():
+                if self._keys[doc] is not None:
+                    best.append((int(counts[doc]), doc))
+                    if len(best) == pool:
+                        break
+        else:
+            counts = Counter()
+            for posting in postings:
+                counts.update(posting)
+            best = heapq.nsmallest(pool, ((count, doc) for doc, count in counts.items()
+                                           if count >= needed and self._keys[doc] is not None),
+                                   key=lambda item: (-item[0], self._sizes[item[1]], item[1]))
+        scored = []
+        for count, doc in best:
+            closeness = max(SequenceMatcher(None, query, text).ratio() for text in self._texts[doc])
+            scored.append(((count / len(grams) + closeness) / 2, self._keys[doc]))
+        scored.sort(key=lambda item: -item[0])
+        return [(key, score) for score, key in scored[:limit]]
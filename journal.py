@@ -0,0 +1,412 @@
+import json
+import os
+import shutil
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to process-local locking only
+    fcntl = None
+
+
+def fsync_directory(path: str):
+    """Flush a directory entry so a rename inside it survives a crash."""
+    try:
+        fd = os.open(path or '.', os.O_RDONLY)
+    except OSError:
+        return  # Not supported on this platform (e.g. Windows)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def file_lock(path: str):
+    """Hold an exclusive inter-process lock on path (created if missing)."""
+    with open(path, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class ProcessLock:
+    """Reentrant, exclusive inter-process lock held on a lock file with flock.
+
+    The first acquire opens and locks the file and the matching last release
+    unlocks it; nested acquires only count. Threads are not told apart, so
+    callers must already serialize their threads (DataManager only takes
+    these while holding its data lock).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._depth = 0
+
+    def acquire(self):
+        if self._depth == 0:
+            self._file = open(self.path, 'a')
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def atomic_write(path: str, write: Callable, binary: bool = False):
+    """Write a file crash-safely: write(f) fills a temp file that then replaces path.
+
+    Readers see either the old file or the complete new one, never a
+    truncated mix, because the temp file is fsynced before the rename.
+    The temp file is opened as UTF-8 text unless binary is set.
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with (open(temp_path, 'wb') if binary else open(temp_path, 'w', encoding='utf-8')) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    fsync_directory(os.path.dirname(path))
+
+
+class GroupCommit:
+    """Shares one fsync between journal appends made within the same commit window.
+
+    With a window of 0 every append is fsynced before it returns. With a
+    positive window the first append starts a timer; every journal written
+    before it fires is fsynced once, so a burst of changes pays a single
+    fsync per file. Either way commit() returns only once the append is on
+    disk. Inside deferred() the wait moves to the end of the block, so a
+    caller can release its own locks first and let other threads' appends
+    join the same fsync.
+    """
+
+    def __init__(self, window: float = 0.0):
+        self.window = window
+        self._cond = threading.Condition()
+        self._dirty = set()
+        self._written = 0
+        self._synced = 0
+        self._timer = None
+        # (first ticket, last ticket, error) of recent batches whose fsync failed
+        self._failures = deque(maxlen=64)
+        self._local = threading.local()
+
+    def register(self, journal: 'JsonLinesJournal') -> int:
+        """Record that a journal has unsynced data; returns a ticket for wait()."""
+        if self.window <= 0:
+            journal.sync()
+            return 0
+        with self._cond:
+            self._dirty.add(journal)
+            self._written += 1
+            if self._timer is None:
+                self._timer = threading.Timer(self.window, self._sync_batch)
+                self._timer.daemon = True
+                self._timer.start()
+            return self._written
+
+    def commit(self, journal: 'JsonLinesJournal'):
+        """Register a journal's appended data and block until it has been fsynced.
+
+        Inside deferred() the ticket is kept and waited for when the block exits.
+        """
+        ticket = self.register(journal)
+        pending = getattr(self._local, 'pending', None)
+        if pending is None:
+            self.wait(ticket)
+        else:
+            self._local.pending = max(pending, ticket)
+
+    @contextmanager
+    def deferred(self):
+        """Wait for the fsync of every commit() in the block once, when the block exits.
+
+        Nested blocks join the outermost one.
+        """
+        if getattr(self._local, 'pending', None) is not None:
+            yield
+            return
+        self._local.pending = 0
+        try:
+            yield
+        finally:
+            ticket, self._local.pending = self._local.pending, None
+        self.wait(ticket)
+
+    def _sync_batch(self):
+        """Fsync every journal written since the last batch."""
+        with self._cond:
+            batch, self._dirty = self._dirty, set()
+            first, covered = self._synced + 1, self._written
+            self._timer = None
+        error = None
+        for journal in batch:
+            try:
+                journal.sync()
+            except OSError as e:
+                error = error or e
+        with self._cond:
+            if error is not None:
+                self._failures.append((first, covered, error))
+            self._synced = max(self._synced, covered)
+            self._cond.notify_all()
+
+    def wait(self, ticket: int):
+        """Block until the append that returned ticket has been fsynced.
+
+        Raises the OSError of a failed fsync that should have covered it.
+        """
+        with self._cond:
+            while self._synced < ticket:
+                self._cond.wait()
+            for first, last, error in self._failures:
+                if first <= ticket <= last:
+                    raise error
+
+    def flush(self):
+        """Fsync all pending appends now."""
+        with self._cond:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._sync_batch()
+
+
+class JsonLinesJournal:
+    """Append-only JSON-Lines file holding one record per line.
+
+    Appending a record writes a single line, so the cost of a write does not
+    depend on how many records are already in the file. Reading streams the
+    file line by line instead of parsing it as one document.
+    """
+
+    def __init__(self, path: str, committer: Optional[GroupCommit] = None):
+        self.path = path
+        self.committer = committer
+        self._file = None
+        self._io_lock = threading.RLock()
+
+    def _open_for_append(self):
+        """Open the journal for appending, dropping a torn last line if there is one."""
+        if self._file is None:
+            self._repair_tail()
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return self._file
+
+    def _repair_tail(self):
+        """Truncate a partially written final line left behind by a crash."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+            # Walk back to the last complete line
+            position = size
+            while position > 0:
+                step = min(4096, position)
+                position -= step
+                f.seek(position)
+                chunk = f.read(step)
+                newline = chunk.rfind(b'\n')
+                if newline != -1:
+                    f.truncate(position + newline + 1)
+                    return
+            f.truncate(0)
+
+    @staticmethod
+    def encode(record: Dict) -> str:
+        """Encode one record (a dict or any mapping) as a compact JSON line."""
+        return json.dumps(record, separators=(',', ':'), default=dict) + '\n'
+
+    def append(self, record: Dict):
+        """Append a single record to the journal."""
+        self._write(self.encode(record))
+
+    def append_many(self, records: Iterable[Dict]):
+        """Append several records with a single write."""
+        data = ''.join(self.encode(record) for record in records)
+        if data:
+            self._write(data)
+
+    def _write(self, data: str):
+        """Write data to the end of the journal; with a group committer, return once it is fsynced."""
+        with self._io_lock:
+            f = self._open_for_append()
+            f.write(data)
+            f.flush()
+        if self.committer is not None:
+            self.committer.commit(self)
+
+    def sync(self):
+        """Fsync the appended data, if the journal is open."""
+        with self._io_lock:
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Stream the records back in the order they were written."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted append
+                    if line.endswith('\n'):
+                        raise
+                    return
+
+    def read_from(self, offset: int) -> List[Dict]:
+        """Return the complete records written at or after byte offset (e.g. by another process)."""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        data = data[:data.rfind(b'\n') + 1]  # A torn last line is not a record yet
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+
+    def rewrite(self, records: Iterable[Dict]):
+        """Replace the journal contents with the given records."""
+
+        def write(f):
+            for record in records:
+                f.write(self.encode(record))
+
+        with self._io_lock:
+            self.close()
+            atomic_write(self.path, write)
+
+    def size(self) -> int:
+        """Return the journal size in bytes."""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def close(self):
+        """Fsync and close the append handle, if open."""
+        with self._io_lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+
+
+class MutationLog(JsonLinesJournal):
+    """Write-ahead log of the mutations applied to one collection.
+
+    Each entry records a single change (add, update, delete, renew) with its
+    key and the changed fields. Compaction seals the live log into a
+    ``.compacting`` segment, writes a fresh snapshot, and then discards the
+    sealed segment, so replaying snapshot + sealed segment + live log always
+    reproduces the latest state even if a crash interrupts compaction.
+    """
+
+    def __init__(self, path: str, committer: Optional[GroupCommit] = None):
+        super().__init__(path, committer)
+        self.sealed_path = path + '.compacting'
+
+    def log(self, op: str, key: str, data: Dict = None):
+        """Append one mutation entry."""
+        self.append(self.make_entry(op, key, data))
+
+    @staticmethod
+    def make_entry(op: str, key: str, data: Dict = None) -> Dict:
+        """Build a mutation entry stamped with the current time."""
+        entry = {'ts': datetime.now().isoformat(timespec='microseconds'), 'op': op, 'key': key}
+        if data is not None:
+            entry['data'] = data
+        return entry
+
+    def entries(self) -> Iterator[Dict]:
+        """Stream the sealed segment (if any) followed by the live log."""
+        if os.path.exists(self.sealed_path):
+            yield from JsonLinesJournal(self.sealed_path)
+        yield from self
+
+    def pending_size(self) -> int:
+        """Return the bytes of log not yet folded into a snapshot."""
+        sealed = os.path.getsize(self.sealed_path) if os.path.exists(self.sealed_path) else 0
+        return sealed + self.size()
+
+    def seal(self):
+        """Move the live log into the sealed segment so new entries start a fresh log."""
+        # Hold the I/O lock throughout so a concurrent append cannot reopen
+        # the old file between closing it and renaming it
+        with self._io_lock:
+            self.close()
+            if not os.path.exists(self.path):
+                return
+            if os.path.exists(self.sealed_path):
+                # A previous compaction was interrupted; keep both segments in order
+                with open(self.path, 'rb') as src, open(self.sealed_path, 'ab') as dst:
+                    shutil.copyfileobj(src, dst)
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.sealed_path)
+            fsync_directory(os.path.dirname(self.path))
+
+    def discard_sealed(self):
+        """Drop the sealed segment once its entries are in a snapshot."""
+        if os.path.exists(self.sealed_path):
+            os.remove(self.sealed_path)
+
+    def archive_sealed(self, directory: str):
+        """Move the sealed segment into an archive directory instead of dropping it.
+
+        Segments are named after the log and the time they were archived, so
+        they sort in the order their entries were written.
+        """
+        if os.path.exists(self.sealed_path):
+            os.makedirs(directory, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%dT%H%M%S%f')
+            os.replace(self.sealed_path, os.path.join(directory, f"{os.path.basename(self.path)}.{stamp}"))
+
+    def archived_segments(self, directory: str) -> List[str]:
+        """Return this log's archived segments in directory, oldest first."""
+        if not os.path.isdir(directory):
+            return []
+        prefix = os.path.basename(self.path) + '.'
+        return [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                if name.startswith(prefix) and name[len(prefix):].replace('T', '').isdigit()]
@@ -0,0 +1,119 @@
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from journal import atomic_write
+
+# Fixed field widths in bytes (UTF-8, NUL padded); the member ID comes first
+# so records sorted by ID can be binary-searched on their first 9 bytes
+MEMBER_FIELDS: List[Tuple[str, int]] = [
+    ('member_id', 9),
+    ('name', 64),
+    ('address', 96),
+    ('city', 48),
+    ('state', 2),
+    ('zip', 10),
+    ('status', 8),
+]
+RECORD_SIZE = sum(width for _, width in MEMBER_FIELDS)
+ID_WIDTH = MEMBER_FIELDS[0][1]
+
+# magic, version, record size, record count, and the size and mtime of the
+# snapshot the store was built from (so a stale store is detected)
+HEADER = struct.Struct('<4sBxHIQQ')
+HEADER_SIZE = 32
+MAGIC = b'CHMS'
+VERSION = 1
+
+
+class MemberStore:
+    """Read-only, memory-mapped file of fixed-width member records sorted by ID.
+
+    The records themselves are the ID index: a lookup binary-searches the
+    mapped file in place and decodes only the one matching record, so no
+    process has to parse the whole member base, and every process that maps
+    the file shares the same page-cache copy.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size < HEADER_SIZE:
+                raise ValueError(f"{path} is truncated")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        magic, version, record_size, count, source_size, source_mtime = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            self.close()
+            raise ValueError(f"{path} is not a member store this version can read")
+        if stat.st_size != HEADER_SIZE + count * RECORD_SIZE:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+        self.count = count
+        self.source = (source_size, source_mtime)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _id_at(self, position: int) -> bytes:
+        offset = HEADER_SIZE + position * RECORD_SIZE
+        return self._map[offset:offset + ID_WIDTH]
+
+    def get(self, member_id: str) -> Optional[Dict]:
+        """Return the member with the given ID, or None."""
+        key = member_id.encode('ascii', 'replace')
+        if len(key) != ID_WIDTH:
+            return None
+        data, low, high = self._map, 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            offset = HEADER_SIZE + middle * RECORD_SIZE
+            if data[offset:offset + ID_WIDTH] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._id_at(low) == key:
+            return self._decode(low)
+        return None
+
+    def _decode(self, position: int) -> Dict:
+        offset = HEADER_SIZE + position * RECORD_SIZE
+        record = {}
+        for field, width in MEMBER_FIELDS:
+            record[field] = self._map[offset:offset + width].rstrip(b'\0').decode('utf-8')
+            offset += width
+        return record
+
+    def close(self):
+        """Unmap the file."""
+        self._map.close()
+
+
+def encode_member(member: Dict) -> bytes:
+    """Pack one member into a fixed-width record; ValueError if it does not fit."""
+    if set(member) != {field for field, _ in MEMBER_FIELDS}:
+        raise ValueError(f"member {member.get('member_id')} has fields the store does not hold")
+    if len(str(member['member_id']).encode('utf-8')) != ID_WIDTH:
+        raise ValueError(f"member ID {member['member_id']!r} is not {ID_WIDTH} characters")
+    parts = []
+    for field, width in MEMBER_FIELDS:
+        raw = str(member[field]).encode('utf-8')
+        if len(raw) > width or b'\0' in raw:
+            raise ValueError(f"{field} of member {member['member_id']} does not fit in {width} bytes")
+        parts.append(raw.ljust(width, b'\0'))
+    return b''.join(parts)
+
+
+def build_member_store(path: str, members: Iterable[Dict], source: os.stat_result):
+    """Write a member store for members, recording the snapshot it was built from."""
+    records = sorted(encode_member(member) for member in members)
+
+    def write(f):
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE, len(records), source.st_size,
+                            source.st_mtime_ns).ljust(HEADER_SIZE, b'\0'))
+        for record in records:
+            f.write(record)
+
+    atomic_write(path, write, binary=True)
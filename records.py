@@ -0,0 +1,158 @@
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Iterator, List, Tuple
+
+
+class Record(MutableMapping):
+    """Dict-compatible record whose known fields live in __slots__.
+
+    Subclasses list their fields as (key, slot) pairs, so a record costs a
+    fixed-size slot array instead of a per-record hash table, and key strings
+    such as 'Current Date/Time' are stored once per class. Values of fields
+    in SHARED repeat across records (service codes, statuses) and are pooled
+    so equal values share one object. Keys outside FIELDS still work; they go
+    to a small overflow dict. Code written for plain dicts (indexing, get,
+    update, iteration, dict(record)) keeps working unchanged.
+    """
+
+    __slots__ = ('_extra',)
+    FIELDS: Tuple[Tuple[str, str], ...] = ()
+    SHARED: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._slot_of = dict(cls.FIELDS)
+        cls._shared = frozenset(cls.SHARED)
+        cls._pool = {}
+
+    def __init__(self, data=(), **fields):
+        self._extra = None
+        if fields:
+            data = dict(data, **fields)
+        items = data.items() if isinstance(data, Mapping) else data
+        # Inlined __setitem__: building records is the hot path when loading
+        slot_of, shared, pool = self._slot_of, self._shared, self._pool
+        for key, value in items:
+            slot = slot_of.get(key)
+            if slot is None:
+                self[key] = value
+                continue
+            if key in shared:
+                value = pool.setdefault(value, value) if type(value) is str else self._share(value)
+            setattr(self, slot, value)
+
+    @classmethod
+    def _share(cls, value):
+        """Return the pooled object equal to value (same type), adding it if new."""
+        # Non-strings are pooled under their type so 100 and 100.0 stay distinct
+        pool_key = value if type(value) is str else (type(value), value)
+        try:
+            return cls._pool.setdefault(pool_key, value)
+        except TypeError:
+            return value  # Unhashable values are simply not pooled
+
+    def __getitem__(self, key):
+        slot = self._slot_of.get(key)
+        if slot is None:
+            if self._extra is not None and key in self._extra:
+                return self._extra[key]
+            raise KeyError(key)
+        try:
+            return getattr(self, slot)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        slot = self._slot_of.get(key)
+        if slot is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+        if key in self._shared:
+            value = self._share(value)
+        setattr(self, slot, value)
+
+    def __delitem__(self, key):
+        slot = self._slot_of.get(key)
+        try:
+            if slot is None:
+                del self._extra[key]
+            else:
+                delattr(self, slot)
+        except (AttributeError, KeyError, TypeError):
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        for key, slot in self.FIELDS:
+            if hasattr(self, slot):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        slot = self._slot_of.get(key)
+        if slot is None:
+            return self._extra is not None and key in self._extra
+        return hasattr(self, slot)
+
+    def get(self, key, default=None):
+        slot = self._slot_of.get(key)
+        if slot is None:
+            return self._extra.get(key, default) if self._extra else default
+        return getattr(self, slot, default)
+
+    def copy(self) -> 'Record':
+        return type(self)(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class Member(Record):
+    FIELDS = (('member_id', 'member_id'), ('name', 'name'), ('address', 'address'), ('city', 'city'),
+              ('state', 'state'), ('zip', 'zip'), ('status', 'status'))
+    SHARED = ('city', 'state', 'status')
+    __slots__ = tuple(slot for _, slot in FIELDS)
+
+
+class Provider(Record):
+    FIELDS = (('provider_id', 'provider_id'), ('name', 'name'), ('address', 'address'), ('city', 'city'),
+              ('state', 'state'), ('zip', 'zip'))
+    SHARED = ('city', 'state')
+    __slots__ = tuple(slot for _, slot in FIELDS)
+
+
+class Service(Record):
+    FIELDS = (('code', 'code'), ('name', 'name'), ('fee', 'fee'))
+    __slots__ = tuple(slot for _, slot in FIELDS)
+
+
+class Claim(Record):
+    FIELDS = (('Claim ID', 'claim_id'), ('Current Date/Time', 'created'), ('Date of Service', 'service_date'),
+              ('Provider Number', 'provider_number'), ('Member ID', 'member_id'),
+              ('Service Code', 'service_code'), ('Service Name', 'service_name'), ('Fee', 'fee'),
+              ('Comments', 'comments'), ('Status', 'status'))
+    SHARED = ('Date of Service', 'Provider Number', 'Member ID', 'Service Code', 'Service Name', 'Fee',
+              'Status')
+    __slots__ = tuple(slot for _, slot in FIELDS)
+
+
+# Record class used for each collection held as a list of records
+RECORD_TYPES = {
+    'members': Member,
+    'providers': Provider,
+    'service_directory': Service,
+    'service_claims': Claim,
+}
+
+
+def as_records(collection: str, items: List[Dict]) -> List[Record]:
+    """Convert the plain dicts in a collection list to its record class, in place."""
+    record_type = RECORD_TYPES[collection]
+    for position, item in enumerate(items):
+        if type(item) is not record_type:
+            items[position] = record_type(item)
+    return items
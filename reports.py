@@ -0,0 +1,241 @@
+import csv
+import heapq
+import os
+import re
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Dict, Iterator, List, Optional
+
+# ChocAn's accounting week runs Saturday through Friday
+WEEK_ENDS_ON = 4  # date.weekday() of Friday
+
+# Rows held in memory per sort before they are spilled to a sorted run file
+RUN_SIZE = 100_000
+
+# Claims read (or rows written) between progress callbacks
+PROGRESS_EVERY = 10_000
+
+# Progress callback: (stage, done, total); total is 0 while it is not known yet
+Progress = Callable[[str, int, int], None]
+
+
+class ReportCancelled(Exception):
+    """Raised when report generation is cancelled before it finished."""
+
+
+def last_week_ending(today: Optional[date] = None) -> date:
+    """Return the Friday ending the most recent accounting week (today if it is a Friday)."""
+    today = today or date.today()
+    return today - timedelta(days=(today.weekday() - WEEK_ENDS_ON) % 7)
+
+
+def _sort_date(date_of_service: str) -> str:
+    """Turn an MM-DD-YYYY date into a YYYY-MM-DD string that sorts by date."""
+    return f"{date_of_service[6:10]}-{date_of_service[0:2]}-{date_of_service[3:5]}"
+
+
+def _file_name(key: str) -> str:
+    return re.sub(r'[^\w-]', '_', key) + '.txt'
+
+
+class ExternalSorter:
+    """Sorts rows of strings while holding at most run_size of them in memory.
+
+    Rows are buffered and, whenever the buffer fills, sorted and spilled to a
+    CSV run file; sorted() then merges the runs (and the last buffer) lazily
+    with heapq.merge. A sort that fits in one buffer never touches the disk.
+    """
+
+    def __init__(self, directory: str, name: str, run_size: int = RUN_SIZE):
+        self.directory = directory
+        self.name = name
+        self.run_size = run_size
+        self._rows: List[List[str]] = []
+        self._runs: List[str] = []
+        self.count = 0
+
+    def add(self, row: List[str]):
+        self._rows.append(row)
+        self.count += 1
+        if len(self._rows) >= self.run_size:
+            self._spill()
+
+    def _spill(self):
+        self._rows.sort()
+        path = os.path.join(self.directory, f"{self.name}_{len(self._runs)}.csv")
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(self._rows)
+        self._runs.append(path)
+        self._rows = []
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator[List[str]]:
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            yield from csv.reader(f)
+
+    def sorted(self) -> Iterator[List[str]]:
+        """Yield every row added so far in sorted order."""
+        self._rows.sort()
+        if not self._runs:
+            return iter(self._rows)
+        return heapq.merge(*(self._read_run(path) for path in self._runs), self._rows)
+
+
+class WeeklyReports:
+    """One week's member reports, provider reports and manager summary.
+
+    The week's claims are streamed once. Each claim becomes one row keyed by
+    member and one keyed by provider, and each set of rows is sorted within
+    a fixed memory budget (see ExternalSorter). Walking the sorted rows then
+    groups them: every member and provider report is written as soon as its
+    group ends, and the summary is totalled along the provider walk, so
+    memory stays bounded however many claims, members or providers the week
+    has. Reports go into a ``week_ending_YYYY-MM-DD`` directory that is
+    written under a temporary name and renamed when complete.
+    """
+
+    def __init__(self, data_manager, week_ending: Optional[date] = None, report_dir: str = "reports",
+                 run_size: int = RUN_SIZE, progress: Optional[Progress] = None,
+                 cancelled: Optional[Callable[[], bool]] = None):
+        self.data_manager = data_manager
+        self.week_ending = week_ending or last_week_ending()
+        self.week_start = self.week_ending - timedelta(days=6)
+        self.report_dir = report_dir
+        self.run_size = run_size
+        self.progress = progress
+        self.cancelled = cancelled
+        self.directory = os.path.join(report_dir, f"week_ending_{self.week_ending.isoformat()}")
+
+    def _report(self, stage: str, done: int, total: int):
+        if self.cancelled is not None and self.cancelled():
+            raise ReportCancelled(f"Report for the week ending {self.week_ending:%m-%d-%Y} was cancelled")
+        if self.progress is not None:
+            self.progress(stage, done, total)
+
+    def generate(self) -> Dict:
+        """Write every report and return the directory and the week's totals."""
+        os.makedirs(self.report_dir, exist_ok=True)
+        work_path = self.directory + '.partial'
+        if os.path.exists(work_path):
+            shutil.rmtree(work_path)  # Left behind by an interrupted run
+        os.makedirs(os.path.join(work_path, 'members'))
+        os.makedirs(os.path.join(work_path, 'providers'))
+        try:
+            with tempfile.TemporaryDirectory(prefix='chocan_report_') as scratch:
+                by_member = ExternalSorter(scratch, 'members', self.run_size)
+                by_provider = ExternalSorter(scratch, 'providers', self.run_size)
+                self._read_claims(by_member, by_provider)
+                members = self._write_member_reports(work_path, by_member)
+                totals = self._write_provider_reports(work_path, by_provider)
+        except BaseException:
+            shutil.rmtree(work_path, ignore_errors=True)
+            raise
+        if os.path.exists(self.directory):
+            shutil.rmtree(self.directory)
+        os.rename(work_path, self.directory)
+        return {'directory': self.directory, 'claims': by_member.count, 'members': members, **totals}
+
+    def _read_claims(self, by_member: ExternalSorter, by_provider: ExternalSorter):
+        stage = "Reading claims"
+        self._report(stage, 0, 0)
+        count = 0
+        for claim in self.data_manager.iter_claims(self.week_start, self.week_ending):
+            date_of_service = claim.get('Date of Service', '')
+            day = _sort_date(date_of_service)
+            received = claim.get('Current Date/Time', '')
+            member_id, provider_number = claim.get('Member ID', ''), claim.get('Provider Number', '')
+            by_member.add([member_id, day, received, date_of_service, provider_number,
+                           claim.get('Service Name', '')])
+            by_provider.add([provider_number, day, received, date_of_service, member_id,
+                             claim.get('Service Code', ''), repr(float(claim.get('Fee') or 0))])
+            count += 1
+            if count % PROGRESS_EVERY == 0:
+                self._report(stage, count, 0)
+        self._report(stage, count, count)
+
+    def _provider_name(self, provider_number: str) -> str:
+        # Looked up per row (an index hit) rather than cached, so memory doesn't grow with the providers
+        provider = self.data_manager.get_provider(provider_number)
+        return provider['name'] if provider is not None else "Unknown provider"
+
+    @staticmethod
+    def _header(kind: str, number: str, record: Optional[Dict]) -> List[str]:
+        if record is None:
+            return [f"{kind} name: Unknown {kind.lower()}", f"{kind} number: {number}"]
+        return [
+            f"{kind} name: {record.get('name', '')}",
+            f"{kind} number: {number}",
+            f"{kind} street address: {record.get('address', '')}",
+            f"{kind} city: {record.get('city', '')}",
+            f"{kind} state: {record.get('state', '')}",
+            f"{kind} zip code: {record.get('zip', '')}",
+        ]
+
+    def _groups(self, stage: str, sorter: ExternalSorter) -> Iterator[tuple]:
+        """Yield (key, rows) for each run of sorted rows sharing their first field; rows is an iterator."""
+        total = sorter.count
+        self._report(stage, 0, total)
+
+        def counted():
+            for done, row in enumerate(sorter.sorted(), 1):
+                yield row
+                if done % PROGRESS_EVERY == 0:
+                    self._report(stage, done, total)
+
+        yield from groupby(counted(), key=itemgetter(0))
+        self._report(stage, total, total)
+
+    def _write_member_reports(self, work_path: str, sorter: ExternalSorter) -> int:
+        members = 0
+        for member_id, rows in self._groups("Writing member reports", sorter):
+            with open(os.path.join(work_path, 'members', _file_name(member_id)), 'w', encoding='utf-8') as f:
+                header = self._header("Member", member_id, self.data_manager.get_member(member_id))
+                f.write('\n'.join(header + ["", "Services:"]) + '\n')
+                for _, _, _, date_of_service, provider_number, service_name in rows:
+                    f.write(f"  {date_of_service}  {self._provider_name(provider_number)}  {service_name}\n")
+            members += 1
+        return members
+
+    def _write_provider_reports(self, work_path: str, sorter: ExternalSorter) -> Dict:
+        providers, consultations, fee_total = 0, 0, 0.0
+        with open(os.path.join(work_path, 'summary.txt'), 'w', encoding='utf-8') as summary:
+            summary.write(f"ChocAn weekly summary: {self.week_start:%m-%d-%Y} to {self.week_ending:%m-%d-%Y}\n\n")
+            summary.write(f"{'Provider':<30} {'Number':<12} {'Consultations':>13} {'Fee':>12}\n")
+            for provider_number, rows in self._groups("Writing provider reports", sorter):
+                provider = self.data_manager.get_provider(provider_number)
+                count, total = 0, 0.0
+                with open(os.path.join(work_path, 'providers', _file_name(provider_number)), 'w',
+                          encoding='utf-8') as f:
+                    f.write('\n'.join(self._header("Provider", provider_number, provider) + ["", "Services:"]) + '\n')
+                    for _, _, received, date_of_service, member_id, service_code, fee in rows:
+                        member = self.data_manager.get_member(member_id)
+                        member_name = member['name'] if member is not None else "Unknown member"
+                        count += 1
+                        total += float(fee)
+                        f.write(f"  {date_of_service}  received {received}  {member_name}  {member_id}  "
+                                f"{service_code}  ${float(fee):.2f}\n")
+                    f.write(f"\nTotal consultations: {count}\nTotal fee: ${total:.2f}\n")
+                name = provider['name'] if provider is not None else "Unknown provider"
+                summary.write(f"{name:<30} {provider_number:<12} {count:>13} {total:>12.2f}\n")
+                providers += 1
+                consultations += count
+                fee_total += total
+            summary.write(f"\nProviders to be paid: {providers}\n")
+            summary.write(f"Total consultations: {consultations}\n")
+            summary.write(f"Overall fee total: ${fee_total:.2f}\n")
+            summary.write(f"Generated: {datetime.now():%m-%d-%Y %H:%M:%S}\n")
+        return {'providers': providers, 'consultations': consultations, 'fee_total': fee_total}
+
+
+def generate_weekly_reports(data_manager, week_ending: Optional[date] = None, report_dir: str = "reports",
+                            **options) -> Dict:
+    """Write the member reports, provider reports and manager summary for one week.
+
+    Returns a dict with the report directory and the week's claim, member,
+    provider and consultation counts and fee total. See WeeklyReports for
+    the options (run_size, progress, cancelled).
+    """
+    return WeeklyReports(data_manager, week_ending, report_dir, **options).generate()
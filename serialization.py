@@ -0,0 +1,312 @@
+import argparse
+import json
+import os
+import struct
+import time
+from typing import Dict, List, Union
+
+from journal import atomic_write
+
+Snapshot = Union[Dict[str, Dict], List[Dict]]
+
+
+class CodecError(ValueError):
+    """Raised when a snapshot file cannot be decoded."""
+
+
+class Codec:
+    """Turns a snapshot (a list of records, or a dict of records by key) into bytes and back."""
+
+    name = None
+    extension = '.json'
+
+    def encode(self, data: Snapshot) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, raw: bytes) -> Snapshot:
+        raise NotImplementedError
+
+
+class PrettyJsonCodec(Codec):
+    """Indented JSON, easy to read and edit by hand (the original format)."""
+
+    name = 'json-pretty'
+
+    def encode(self, data: Snapshot) -> bytes:
+        return json.dumps(data, indent=2, default=dict).encode('utf-8')
+
+    def decode(self, raw: bytes) -> Snapshot:
+        return json.loads(raw)
+
+
+class CompactJsonCodec(PrettyJsonCodec):
+    """JSON without indentation or spaces; still readable by any JSON tool."""
+
+    name = 'json-compact'
+
+    def encode(self, data: Snapshot) -> bytes:
+        return json.dumps(data, separators=(',', ':'), default=dict).encode('utf-8')
+
+
+class BinaryRecordCodec(Codec):
+    """Length-prefixed binary records with a shared field-name table.
+
+    Layout (little-endian)::
+
+        magic "CHCB" version:u8 kind:u8 ('l' list / 'm' dict by key)
+        field_count:u16  field_count x (length:u16 utf-8 name)
+        record_count:u32 record_count x (length:u32 record)
+        record = [key (dict snapshots only)] field_count:u16
+                 field_count x (field:u16 tag:u8 value)
+
+    Values are tagged: n None, t/f booleans, i int64, d float64, s short
+    string (length:u8 utf-8), S long string (length:u32 utf-8) and j for
+    anything else, stored as a long string of JSON.
+    Field names are written once per file instead of once per record, and
+    each record carries its length so a reader can skip over it.
+    """
+
+    name = 'binary'
+    extension = '.bin'
+    MAGIC = b'CHCB'
+    VERSION = 1
+
+    _header = struct.Struct('<4sBc')
+    _u16 = struct.Struct('<H')
+    _u32 = struct.Struct('<I')
+    _field = struct.Struct('<Hc')
+    _int = struct.Struct('<q')
+    _float = struct.Struct('<d')
+
+    def encode(self, data: Snapshot) -> bytes:
+        keyed = isinstance(data, dict)
+        records = list(data.values()) if keyed else data
+        fields = {}
+        for record in records:
+            for field in record:
+                if field not in fields:
+                    fields[field] = len(fields)
+        if len(fields) > 0xFFFF:
+            raise CodecError("too many distinct field names for the binary codec")
+
+        out = bytearray(self._header.pack(self.MAGIC, self.VERSION, b'm' if keyed else b'l'))
+        out += self._u16.pack(len(fields))
+        for field in fields:
+            self._put_short(out, field)
+        out += self._u32.pack(len(records))
+        items = data.items() if keyed else ((None, record) for record in records)
+        for key, record in items:
+            body = bytearray()
+            if keyed:
+                self._put_string(body, key)
+            body += self._u16.pack(len(record))
+            for field, value in record.items():
+                self._put_value(body, fields[field], value)
+            out += self._u32.pack(len(body))
+            out += body
+        return bytes(out)
+
+    def _put_short(self, out: bytearray, text: str):
+        raw = text.encode('utf-8')
+        out += self._u16.pack(len(raw))
+        out += raw
+
+    def _put_string(self, out: bytearray, text: str):
+        raw = text.encode('utf-8')
+        out += self._u32.pack(len(raw))
+        out += raw
+
+    def _put_value(self, out: bytearray, field: int, value):
+        if value is None:
+            out += self._field.pack(field, b'n')
+        elif value is True or value is False:
+            out += self._field.pack(field, b't' if value else b'f')
+        elif type(value) is int and -2 ** 63 <= value < 2 ** 63:
+            out += self._field.pack(field, b'i')
+            out += self._int.pack(value)
+        elif type(value) is float:
+            out += self._field.pack(field, b'd')
+            out += self._float.pack(value)
+        elif type(value) is str:
+            raw = value.encode('utf-8')
+            if len(raw) < 256:
+                out += self._field.pack(field, b's')
+                out.append(len(raw))
+            else:
+                out += self._field.pack(field, b'S')
+                out += self._u32.pack(len(raw))
+            out += raw
+        else:
+            out += self._field.pack(field, b'j')
+            self._put_string(out, json.dumps(value, separators=(',', ':')))
+
+    def decode(self, raw: bytes) -> Snapshot:
+        try:
+            return self._decode(raw)
+        except (struct.error, UnicodeDecodeError, IndexError, KeyError, json.JSONDecodeError) as e:
+            raise CodecError(f"corrupt binary snapshot: {e}") from e
+
+    def _decode(self, raw: bytes) -> Snapshot:
+        magic, version, kind = self._header.unpack_from(raw, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise CodecError("not a binary snapshot (bad magic or version)")
+        keyed = kind == b'm'
+        u16, u32 = self._u16.unpack_from, self._u32.unpack_from
+        field_tag, int_at, float_at = self._field.unpack_from, self._int.unpack_from, self._float.unpack_from
+        position = self._header.size
+
+        (field_count,) = u16(raw, position)
+        position += 2
+        fields = []
+        for _ in range(field_count):
+            (length,) = u16(raw, position)
+            position += 2
+            fields.append(raw[position:position + length].decode('utf-8'))
+            position += length
+
+        (record_count,) = u32(raw, position)
+        position += 4
+        records = {} if keyed else []
+        for _ in range(record_count):
+            (length,) = u32(raw, position)
+            position += 4
+            end = position + length
+            if keyed:
+                (key_length,) = u32(raw, position)
+                position += 4
+                key = raw[position:position + key_length].decode('utf-8')
+                position += key_length
+            (count,) = u16(raw, position)
+            position += 2
+            record = {}
+            for _ in range(count):
+                field, tag = field_tag(raw, position)
+                position += 3
+                if tag == b's':
+                    text_length = raw[position]
+                    position += 1
+                    value = raw[position:position + text_length].decode('utf-8')
+                    position += text_length
+                elif tag == b'i':
+                    (value,) = int_at(raw, position)
+                    position += 8
+                elif tag == b'd':
+                    (value,) = float_at(raw, position)
+                    position += 8
+                elif tag == b'S':
+                    (text_length,) = u32(raw, position)
+                    position += 4
+                    value = raw[position:position + text_length].decode('utf-8')
+                    position += text_length
+                elif tag == b'n':
+                    value = None
+                elif tag == b't':
+                    value = True
+                elif tag == b'f':
+                    value = False
+                elif tag == b'j':
+                    (text_length,) = u32(raw, position)
+                    position += 4
+                    value = json.loads(raw[position:position + text_length])
+                    position += text_length
+                else:
+                    raise CodecError(f"unknown value tag {tag!r}")
+                record[fields[field]] = value
+            if position != end:
+                raise CodecError("record length does not match its contents")
+            if keyed:
+                records[key] = record
+            else:
+                records.append(record)
+        if position != len(raw):
+            raise CodecError("snapshot is truncated or has trailing data")
+        return records
+
+
+CODECS = {codec.name: codec for codec in (PrettyJsonCodec(), CompactJsonCodec(), BinaryRecordCodec())}
+DEFAULT_CODEC = 'json-pretty'
+
+
+def get_codec(name: str) -> Codec:
+    """Return the codec registered under name."""
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown codec {name!r}; choose from {', '.join(CODECS)}") from None
+
+
+def detect_codec(raw: bytes) -> Codec:
+    """Pick the codec that can read raw (every JSON codec reads any JSON)."""
+    if raw.startswith(BinaryRecordCodec.MAGIC):
+        return CODECS['binary']
+    return CODECS[DEFAULT_CODEC]
+
+
+def read_file(path: str) -> Snapshot:
+    """Read a snapshot file in whichever format it was written."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return detect_codec(raw).decode(raw)
+
+
+def write_file(path: str, data: Snapshot, codec: Codec):
+    """Write a snapshot file crash-safely with the given codec."""
+    encoded = codec.encode(data)
+    atomic_write(path, lambda f: f.write(encoded), binary=True)
+
+
+def convert_file(source: str, target: str, codec_name: str):
+    """Rewrite a snapshot file in another format."""
+    write_file(target, read_file(source), get_codec(codec_name))
+
+
+def sample_members(count: int) -> List[Dict]:
+    """Build member-shaped records for benchmarking."""
+    return [
+        {'member_id': f"{100000000 + i}", 'name': f"Member {i}", 'address': f"{i} Main St",
+         'city': 'Portland', 'state': 'OR', 'zip': f"{97000 + i % 1000:05d}",
+         'status': 'Valid' if i % 7 else 'Expired'}
+        for i in range(count)
+    ]
+
+
+def benchmark(data: Snapshot, directory: str, rounds: int = 3) -> List[Dict]:
+    """Time saving and loading data with every codec; returns one row per codec."""
+    results = []
+    for codec in CODECS.values():
+        path = os.path.join(directory, f"benchmark{codec.extension}")
+        save = load = float('inf')
+        for _ in range(rounds):
+            start = time.perf_counter()
+            write_file(path, data, codec)
+            save = min(save, time.perf_counter() - start)
+            start = time.perf_counter()
+            read_file(path)
+            load = min(load, time.perf_counter() - start)
+        results.append({'codec': codec.name, 'save_s': save, 'load_s': load, 'bytes': os.path.getsize(path)})
+        os.remove(path)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert or benchmark ChocAn snapshot files.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    convert = commands.add_parser('convert', help="rewrite a snapshot file in another format")
+    convert.add_argument('source')
+    convert.add_argument('target')
+    convert.add_argument('--codec', choices=list(CODECS), required=True)
+    bench = commands.add_parser('benchmark', help="time every codec on sample member records")
+    bench.add_argument('--records', type=int, default=100000)
+    bench.add_argument('--dir', default='.')
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        convert_file(args.source, args.target, args.codec)
+    else:
+        print(f"{'codec':<14}{'save (s)':>10}{'load (s)':>10}{'size (bytes)':>15}")
+        for row in benchmark(sample_members(args.records), args.dir):
+            print(f"{row['codec']:<14}{row['save_s']:>10.3f}{row['load_s']:>10.3f}{row['bytes']:>15,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,833 @@
+import os
+import random
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Union
+
+from backup import create_backup, prune_backups
+from changes import ADDED, DELETED, RELOADED, UPDATED
+from data_manager import TEXT_INDEXES, DataManager, provider_username
+from indexes import TrigramIndex
+from journal import GroupCommit
+
+# Column layout for each table, in the order the dict keys are exposed
+MEMBER_COLUMNS = ('member_id', 'name', 'address', 'city', 'state', 'zip', 'status')
+PROVIDER_COLUMNS = ('provider_id', 'name', 'address', 'city', 'state', 'zip')
+SERVICE_COLUMNS = ('code', 'name', 'fee')
+
+# Table -> (collection its change events name, columns of the record they carry)
+TABLE_COLLECTIONS = {
+    'members': ('members', MEMBER_COLUMNS),
+    'providers': ('providers', PROVIDER_COLUMNS),
+    'services': ('service_directory', SERVICE_COLUMNS),
+}
+
+# Service claims use display-style keys, so map them onto SQL column names
+CLAIM_COLUMNS = (
+    ('claim_id', 'Claim ID'),
+    ('created_at', 'Current Date/Time'),
+    ('date_of_service', 'Date of Service'),
+    ('provider_number', 'Provider Number'),
+    ('member_id', 'Member ID'),
+    ('service_code', 'Service Code'),
+    ('service_name', 'Service Name'),
+    ('fee', 'Fee'),
+    ('comments', 'Comments'),
+    ('status', 'Status'),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_key TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    password TEXT NOT NULL,
+    role TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_users_username ON users (username);
+
+CREATE TABLE IF NOT EXISTS members (
+    member_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    address TEXT,
+    city TEXT,
+    state TEXT,
+    zip TEXT,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_members_status ON members (status);
+CREATE INDEX IF NOT EXISTS idx_members_state ON members (state);
+CREATE INDEX IF NOT EXISTS idx_members_zip ON members (zip);
+
+CREATE TABLE IF NOT EXISTS providers (
+    provider_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    address TEXT,
+    city TEXT,
+    state TEXT,
+    zip TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_providers_name ON providers (name);
+CREATE INDEX IF NOT EXISTS idx_providers_username ON providers (replace(lower(name), ' ', ''));
+
+CREATE TABLE IF NOT EXISTS services (
+    code TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    fee REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS service_claims (
+    claim_id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    date_of_service TEXT NOT NULL,
+    service_date TEXT,
+    provider_number TEXT NOT NULL,
+    member_id TEXT NOT NULL,
+    service_code TEXT NOT NULL,
+    service_name TEXT,
+    fee REAL,
+    comments TEXT,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_claims_member ON service_claims (member_id);
+CREATE INDEX IF NOT EXISTS idx_claims_provider ON service_claims (provider_number, service_date);
+CREATE INDEX IF NOT EXISTS idx_claims_service ON service_claims (service_code);
+CREATE INDEX IF NOT EXISTS idx_claims_service_date ON service_claims (service_date);
+CREATE INDEX IF NOT EXISTS idx_claims_status ON service_claims (status);
+
+CREATE TABLE IF NOT EXISTS sequences (
+    name TEXT PRIMARY KEY,
+    next_value INTEGER NOT NULL
+);
+"""
+
+
+def to_iso_date(date_of_service: Union[str, date, None]) -> Optional[str]:
+    """Convert an MM-DD-YYYY date of service to a sortable YYYY-MM-DD string."""
+    if isinstance(date_of_service, date):
+        return date_of_service.isoformat()
+    try:
+        return datetime.strptime(date_of_service, "%m-%d-%Y").strftime("%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+
+
+class SQLiteDataManager(DataManager):
+    """DataManager backed by an indexed SQLite database instead of JSON files.
+
+    The public methods behave like their JSON counterparts, but every lookup
+    goes through a primary-key or secondary index and every mutation touches
+    only the affected rows. Existing JSON files in the data directory are
+    imported the first time the database is created.
+    """
+
+    def __init__(self, data_dir="data", db_name="chocan.db", claim_id_block: int = 64):
+        """Open (or create) the SQLite database inside the data directory.
+
+        Claim IDs come from the persisted sequences table; each process
+        reserves claim_id_block IDs at a time, like the JSON store does.
+        """
+        self.data_dir = data_dir
+        self.ensure_data_directory()
+
+        # The JSON paths and logs are kept so the initial import and backups can find them
+        self.group_commit = GroupCommit()
+        self.setup_files()
+        self.db_file = os.path.join(data_dir, db_name)
+
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self.claim_id_block = claim_id_block
+        self._next_claim_id = self._claim_id_limit = 0
+        self._subscribers = []
+        self._events = []
+        # Member trigram index for search_members(), built on the first search
+        self._member_index = None
+        self._member_index_version = None
+        self._loaded = set()
+        self._closed = threading.Event()
+        self.shared = False  # SQLite already coordinates writers across processes
+        self._backup_lock = threading.Lock()
+        self._backup_threads = []
+        self.last_backup = None
+        is_new = not os.path.exists(self.db_file)
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        if is_new:
+            self.import_json_files()
+
+        # Users are a handful of rows and the GUI edits the dict directly,
+        # so they stay cached in memory and save_users() syncs the table.
+        self.users = self.load_users()
+
+        self.initialize_default_data()
+
+    def initialize_default_data(self):
+        """Seed default data only when a table is empty, without loading full tables."""
+        with self._lock:
+            empty = any(
+                self.conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is None
+                for table in ('members', 'services')
+            )
+        if empty or not self.users:
+            super().initialize_default_data()
+
+    def close(self):
+        """Stop background backups and close the database connection."""
+        self._closed.set()
+        for thread in self._backup_threads:
+            thread.join()
+        with self._lock:
+            self.conn.close()
+
+    def flush(self):
+        """Nothing is queued: every change is committed when it is made."""
+
+    def import_json_files(self):
+        """Import any existing JSON data files into the database."""
+        self.users = super().load_users()
+        self.save_users()
+        self.members = super().load_members()
+        self.providers = super().load_providers()
+        self.service_directory = super().load_service_directory()
+        self.service_claims = super().load_service_claims()
+
+    # Transactions
+    @contextmanager
+    def _transaction(self):
+        """Run statements in a transaction, or as part of the open batch.
+
+        Change events queued by the statements are delivered once the
+        transaction commits.
+        """
+        with self._lock:
+            if self._batch_depth:
+                yield
+                return
+            try:
+                with self.conn:
+                    yield
+            except BaseException:
+                self._claim_id_limit = 0  # A block reserved in the transaction was rolled back with it
+                raise
+        self._dispatch()
+
+    @contextmanager
+    def batch(self):
+        """Run every mutation in the block as one SQLite transaction.
+
+        The transaction commits once when the block exits and rolls back
+        (restoring the cached users too) if it raises.
+        """
+        with self._lock:
+            if self._batch_depth:
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                return
+            users = {key: dict(user) for key, user in self.users.items()}
+            self._batch_depth = 1
+            first_event = len(self._events)
+            try:
+                with self.conn:
+                    yield self
+            except BaseException:
+                del self._events[first_event:]
+                self._claim_id_limit = 0  # A block reserved in the batch was rolled back with it
+                self._member_index = None  # May hold rows that were rolled back
+                self.users = users
+                raise
+            finally:
+                self._batch_depth = 0
+        self._dispatch()
+
+    # Row conversion helpers
+    def _replace_rows(self, table: str, columns, rows):
+        """Replace every row of a table with the given sequence of tuples."""
+        placeholders = ', '.join('?' for _ in columns)
+        with self._transaction():
+            self.conn.execute(f"DELETE FROM {table}")
+            self.conn.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                rows
+            )
+            self._notify(TABLE_COLLECTIONS.get(table, (table,))[0], RELOADED)
+            if table == 'members':
+                self._member_index = None
+
+    def _select(self, sql: str, params=()) -> List[Dict]:
+        """Run a query and return the rows as plain dicts."""
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def _claim_from_row(self, row) -> Dict:
+        """Convert a service_claims row into the claim dict layout."""
+        claim = {key: row[column] for column, key in CLAIM_COLUMNS}
+        claim['Claim ID'] = str(claim['Claim ID'])
+        return claim
+
+    def _update_row(self, table: str, key_column: str, key: str, allowed, fields: Dict) -> bool:
+        """Update selected columns of one row, returning False if it does not exist."""
+        unknown = set(fields) - set(allowed)
+        if unknown:
+            raise ValueError(f"Unknown {table} field(s): {', '.join(sorted(unknown))}")
+        with self._transaction():
+            if not fields:
+                row = self.conn.execute(f"SELECT 1 FROM {table} WHERE {key_column} = ?", (key,)).fetchone()
+                return row is not None
+            assignments = ', '.join(f"{column} = ?" for column in fields)
+            cursor = self.conn.execute(
+                f"UPDATE {table} SET {assignments} WHERE {key_column} = ?",
+                (*fields.values(), key)
+            )
+            if cursor.rowcount > 0:
+                self._row_changed(table, key, UPDATED)
+            return cursor.rowcount > 0
+
+    def _delete_row(self, table: str, key_column: str, key: str) -> bool:
+        """Delete one row by key, returning False if it does not exist."""
+        with self._transaction():
+            cursor = self.conn.execute(f"DELETE FROM {table} WHERE {key_column} = ?", (key,))
+            if cursor.rowcount > 0:
+                self._row_changed(table, key, DELETED)
+            return cursor.rowcount > 0
+
+    def _row_changed(self, table: str, key: str, kind: str):
+        """Queue a change event for one row, carrying the row as it is now, and keep the member index current."""
+        indexed = table == 'members' and self._member_index is not None
+        if not self._subscribers and not indexed:
+            return
+        collection, columns = TABLE_COLLECTIONS[table]
+        record = None
+        if kind != DELETED:
+            rows = self._select(f"SELECT {', '.join(columns)} FROM {table} WHERE {columns[0]} = ?", (key,))
+            record = rows[0] if rows else None
+        if indexed:
+            self._member_index.remove(key)
+            if record is not None:
+                self._member_index.add(key, record)
+        self._notify(collection, kind, key, record)
+
+    def _exists(self, table: str, key_column: str, key: str) -> bool:
+        """Check whether a row with the given key exists."""
+        with self._lock:
+            return self.conn.execute(
+                f"SELECT 1 FROM {table} WHERE {key_column} = ?", (key,)
+            ).fetchone() is not None
+
+    # Collection views used by the GUI
+    @property
+    def members(self) -> List[Dict]:
+        return self._select(f"SELECT {', '.join(MEMBER_COLUMNS)} FROM members ORDER BY rowid")
+
+    @members.setter
+    def members(self, members: List[Dict]):
+        self._replace_rows('members', MEMBER_COLUMNS,
+                           [tuple(m.get(c) for c in MEMBER_COLUMNS) for m in members])
+
+    @property
+    def providers(self) -> List[Dict]:
+        return self._select(f"SELECT {', '.join(PROVIDER_COLUMNS)} FROM providers ORDER BY rowid")
+
+    @providers.setter
+    def providers(self, providers: List[Dict]):
+        self._replace_rows('providers', PROVIDER_COLUMNS,
+                           [tuple(p.get(c) for c in PROVIDER_COLUMNS) for p in providers])
+
+    @property
+    def service_directory(self) -> List[Dict]:
+        return self._select(f"SELECT {', '.join(SERVICE_COLUMNS)} FROM services ORDER BY rowid")
+
+    @service_directory.setter
+    def service_directory(self, services: List[Dict]):
+        self._replace_rows('services', SERVICE_COLUMNS,
+                           [tuple(s.get(c) for c in SERVICE_COLUMNS) for s in services])
+
+    @property
+    def service_claims(self) -> List[Dict]:
+        with self._lock:
+            rows = self.conn.execute("SELECT * FROM service_claims ORDER BY claim_id").fetchall()
+        return [self._claim_from_row(row) for row in rows]
+
+    @service_claims.setter
+    def service_claims(self, claims: List[Dict]):
+        columns = [column for column, _ in CLAIM_COLUMNS] + ['service_date']
+        rows = [
+            tuple(c.get(key) for _, key in CLAIM_COLUMNS) + (to_iso_date(c.get('Date of Service')),)
+            for c in claims
+        ]
+        self._replace_rows('service_claims', columns, rows)
+
+    # Persistence hooks (each mutation is committed as it happens)
+    def load_users(self) -> Dict:
+        """Load users from the database."""
+        rows = self._select("SELECT user_key, username, password, role FROM users ORDER BY rowid")
+        return {
+            row['user_key']: {'username': row['username'], 'password': row['password'], 'role': row['role']}
+            for row in rows
+        }
+
+    def save_users(self):
+        """Sync the cached users dict to the database."""
+        self._replace_rows('users', ('user_key', 'username', 'password', 'role'), [
+            (key, u['username'], u['password'], u['role']) for key, u in self.users.items()
+        ])
+
+    def load_members(self) -> List[Dict]:
+        return self.members
+
+    def save_members(self):
+        """Members are committed row by row; nothing to flush."""
+
+    def load_providers(self) -> List[Dict]:
+        return self.providers
+
+    def save_providers(self):
+        """Providers are committed row by row; nothing to flush."""
+
+    def load_service_claims(self) -> List[Dict]:
+        return self.service_claims
+
+    def save_service_claims(self):
+        """Claims are committed row by row; nothing to flush."""
+
+    def load_service_directory(self) -> List[Dict]:
+        return self.service_directory
+
+    def save_service_directory(self):
+        """Services are committed row by row; nothing to flush."""
+
+    # ID generation
+    def generate_provider_id(self) -> str:
+        """Generate a unique 9-digit provider ID."""
+        while True:
+            provider_id = str(random.randint(100000000, 999999999))
+            if not self._exists('providers', 'provider_id', provider_id):
+                return provider_id
+
+    def generate_member_id(self) -> str:
+        """Generate a unique 9-digit member ID."""
+        while True:
+            member_id = str(random.randint(100000000, 999999999))
+            if not self._exists('members', 'member_id', member_id):
+                return member_id
+
+    def _reserve_claim_ids(self) -> range:
+        """Reserve the next claim_id_block claim IDs in the sequences table."""
+        # A new sequence starts above any claim imported before it existed
+        self.conn.execute(
+            "INSERT OR IGNORE INTO sequences (name, next_value) "
+            "SELECT 'claim', MAX(COALESCE(MAX(claim_id), 1000000) + 1, 1000001) FROM service_claims"
+        )
+        self.conn.execute("UPDATE sequences SET next_value = next_value + ? WHERE name = 'claim'",
+                          (self.claim_id_block,))
+        row = self.conn.execute("SELECT next_value FROM sequences WHERE name = 'claim'").fetchone()
+        return range(row[0] - self.claim_id_block, row[0])
+
+    def generate_claim_id(self) -> str:
+        """Generate a unique claim ID from the persisted, block-reserved claim sequence."""
+        with self._lock:
+            if self._next_claim_id >= self._claim_id_limit:
+                if self.conn.in_transaction:
+                    block = self._reserve_claim_ids()  # Commits with the caller's transaction
+                else:
+                    with self.conn:
+                        block = self._reserve_claim_ids()
+                self._next_claim_id, self._claim_id_limit = block.start, block.stop
+            claim_id = self._next_claim_id
+            self._next_claim_id += 1
+        return str(claim_id)
+
+    # User management methods
+    def authenticate_user(self, username: str, password: str, role: str) -> bool:
+        """Authenticate a user."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT password, role FROM users WHERE username = ?", (username,)
+            ).fetchone()
+        return bool(row) and row['password'] == password and row['role'] == role
+
+    def rebuild_user_index(self):
+        """Usernames are indexed by the users table."""
+
+    def get_user(self, username: str) -> Optional[Dict]:
+        """Get a user by username (case-sensitive)."""
+        rows = self._select("SELECT username, password, role FROM users WHERE username = ?", (username,))
+        return rows[0] if rows else None
+
+    def delete_user(self, username: str) -> bool:
+        """Delete a user account."""
+        with self._transaction():
+            row = self.conn.execute("SELECT user_key FROM users WHERE username = ?", (username,)).fetchone()
+            if row is None:
+                return False
+            self.conn.execute("DELETE FROM users WHERE user_key = ?", (row['user_key'],))
+            self.users.pop(row['user_key'], None)
+            self._notify('users', DELETED, row['user_key'])
+        return True
+
+    def add_user(self, username: str, password: str, role: str) -> bool:
+        """Add a new user."""
+        with self._lock:
+            if username in self.users or self.get_user(username):
+                return False  # User already exists
+            try:
+                with self._transaction():
+                    self.conn.execute(
+                        "INSERT INTO users (user_key, username, password, role) VALUES (?, ?, ?, ?)",
+                        (username, username, password, role)
+                    )
+            except sqlite3.IntegrityError:
+                return False
+            self.users[username] = {'username': username, 'password': password, 'role': role}
+            self._notify('users', ADDED, username, self.users[username])
+        self._dispatch()
+        return True
+
+    # Member management methods
+    def add_member(self, name: str, address: str, city: str, state: str, zip_code: str) -> str:
+        """Add a new member and return the generated member ID."""
+        with self._transaction():
+            member_id = self.generate_member_id()
+            self.conn.execute(
+                "INSERT INTO members (member_id, name, address, city, state, zip, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, 'Valid')",
+                (member_id, name, address, city, state.upper(), zip_code)
+            )
+            self._row_changed('members', member_id, ADDED)
+        return member_id
+
+    def get_member(self, member_id: str) -> Optional[Dict]:
+        """Get a member by ID."""
+        rows = self._select(
+            f"SELECT {', '.join(MEMBER_COLUMNS)} FROM members WHERE member_id = ?", (member_id,)
+        )
+        return rows[0] if rows else None
+
+    def update_member(self, member_id: str, **kwargs) -> bool:
+        """Update member information."""
+        return self._update_row('members', 'member_id', member_id, MEMBER_COLUMNS[1:], kwargs)
+
+    def delete_member(self, member_id: str) -> bool:
+        """Delete a member."""
+        return self._delete_row('members', 'member_id', member_id)
+
+    def renew_member(self, member_id: str) -> bool:
+        """Renew an expired member."""
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE members SET status = 'Valid' WHERE member_id = ? AND status = 'Expired'",
+                (member_id,)
+            )
+            if cursor.rowcount > 0:
+                self._row_changed('members', member_id, UPDATED)
+            return cursor.rowcount > 0
+
+    # Provider management methods
+    def add_provider(self, name: str, address: str, city: str, state: str, zip_code: str) -> str:
+        """Add a new provider and return the generated provider ID."""
+        with self._transaction():
+            provider_id = self.generate_provider_id()
+            self.conn.execute(
+                "INSERT INTO providers (provider_id, name, address, city, state, zip) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (provider_id, name, address, city, state.upper(), zip_code)
+            )
+            self._row_changed('providers', provider_id, ADDED)
+
+        # Create a user account for the provider
+        username = provider_username(name)  # Create username from name
+        password = f"{provider_id}"  # Use provider ID as initial password
+        self.add_user(username, password, 'provider')
+
+        return provider_id
+
+    def get_provider(self, provider_id: str) -> Optional[Dict]:
+        """Get a provider by ID."""
+        rows = self._select(
+            f"SELECT {', '.join(PROVIDER_COLUMNS)} FROM providers WHERE provider_id = ?", (provider_id,)
+        )
+        return rows[0] if rows else None
+
+    def get_provider_by_username(self, username: str) -> Optional[Dict]:
+        """Get a provider by username."""
+        with self._lock:
+            user = self.conn.execute(
+                "SELECT role FROM users WHERE username = ?", (username,)
+            ).fetchone()
+        if not user or user['role'] != 'provider':
+            return None
+        rows = self._select(
+            f"SELECT {', '.join(PROVIDER_COLUMNS)} FROM providers "
+            "WHERE replace(lower(name), ' ', '') = ? LIMIT 1", (username,)
+        )
+        return rows[0] if rows else None
+
+    def update_provider(self, provider_id: str, **kwargs) -> bool:
+        """Update provider information."""
+        return self._update_row('providers', 'provider_id', provider_id, PROVIDER_COLUMNS[1:], kwargs)
+
+    def delete_provider(self, provider_id: str) -> bool:
+        """Delete a provider."""
+        return self._delete_row('providers', 'provider_id', provider_id)
+
+    # Service claims management methods
+    def add_service_claim(self, member_id: str, date_of_service: str, provider_number: str,
+                         service_code: str, comments: str = "") -> str:
+        """Add a new service claim and return the claim ID."""
+        service = self.get_service(service_code)
+        if not service:
+            raise ValueError(f"Service code {service_code} not found")
+
+        current_datetime = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
+        with self._transaction():
+            claim_id = self.generate_claim_id()
+            self.conn.execute(
+                "INSERT INTO service_claims (claim_id, created_at, date_of_service, service_date, "
+                "provider_number, member_id, service_code, service_name, fee, comments, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'Pending')",
+                (int(claim_id), current_datetime, date_of_service, to_iso_date(date_of_service),
+                 provider_number, member_id, service_code, service['name'], service['fee'], comments)
+            )
+            if self._subscribers:
+                row = self.conn.execute(
+                    "SELECT * FROM service_claims WHERE claim_id = ?", (int(claim_id),)
+                ).fetchone()
+                self._notify('service_claims', ADDED, claim_id, self._claim_from_row(row))
+        return claim_id
+
+    def find_claims(self, member_id: Optional[str] = None, provider_number: Optional[str] = None,
+                    service_code: Optional[str] = None, start: Union[str, date, None] = None,
+                    end: Union[str, date, None] = None) -> List[Dict]:
+        """Find claims matching every given field and an inclusive date-of-service range."""
+        conditions = [
+            (f"{column} = ?", value)
+            for column, value in (('member_id', member_id), ('provider_number', provider_number),
+                                  ('service_code', service_code))
+            if value is not None
+        ]
+        if start is not None:
+            conditions.append(("service_date >= ?", to_iso_date(start)))
+        if end is not None:
+            conditions.append(("service_date <= ?", to_iso_date(end)))
+        where = ' AND '.join(condition for condition, _ in conditions) or '1'
+        order = 'service_date, claim_id' if start is not None or end is not None else 'claim_id'
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM service_claims WHERE {where} ORDER BY {order}",
+                tuple(value for _, value in conditions)
+            ).fetchall()
+        return [self._claim_from_row(row) for row in rows]
+
+    def iter_claims(self, start: Union[str, date], end: Union[str, date]) -> Iterator[Dict]:
+        """Stream the claims with a date of service in an inclusive range, in no particular order.
+
+        The rows are read through a connection of their own, so a long report
+        sees one consistent snapshot and never holds the lock writers need.
+        A date that can't be parsed raises ValueError at once.
+        """
+        low, high = to_iso_date(start), to_iso_date(end)
+        for bound, iso in ((start, low), (end, high)):
+            if iso is None:
+                raise ValueError(f"Invalid date of service {bound!r}; expected MM-DD-YYYY")
+        return self._iter_claims(low, high)
+
+    def _iter_claims(self, low: str, high: str) -> Iterator[Dict]:
+        """Yield the claims dated between two ISO dates, inclusive."""
+        conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(
+                "SELECT * FROM service_claims WHERE service_date >= ? AND service_date <= ?",
+                (low, high)
+            )
+            for row in rows:
+                yield self._claim_from_row(row)
+        finally:
+            conn.close()
+
+    def _grouped(self, select: str, group: str, start, end) -> List:
+        """Run a GROUP BY over claims in an inclusive date-of-service range."""
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("service_date >= ?")
+            params.append(to_iso_date(start))
+        if end is not None:
+            conditions.append("service_date <= ?")
+            params.append(to_iso_date(end))
+        where = ' AND '.join(conditions) or '1'
+        with self._lock:
+            return self.conn.execute(
+                f"SELECT {select} FROM service_claims WHERE {where} GROUP BY {group} ORDER BY {group}", params
+            ).fetchall()
+
+    def fee_totals_by_provider(self, start: Union[str, date, None] = None,
+                               end: Union[str, date, None] = None) -> Dict[str, float]:
+        """Sum claim fees per provider number, optionally within a date-of-service range."""
+        rows = self._grouped("provider_number, SUM(fee)", "provider_number", start, end)
+        return {provider: total for provider, total in rows}
+
+    def claim_counts_by_service_code(self, start: Union[str, date, None] = None,
+                                     end: Union[str, date, None] = None) -> Dict[str, int]:
+        """Count claims per service code, optionally within a date-of-service range."""
+        rows = self._grouped("service_code, COUNT(*)", "service_code", start, end)
+        return {code: count for code, count in rows}
+
+    def claim_counts_per_week(self, start: Union[str, date, None] = None,
+                              end: Union[str, date, None] = None) -> Dict[date, int]:
+        """Count claims per week of service, keyed by the Monday that starts the week."""
+        # Monday on or before the service date
+        week = "date(service_date, '-6 days', 'weekday 1')"
+        rows = self._grouped(f"{week} AS week, COUNT(*)", "week", start, end)
+        return {date.fromisoformat(monday): count for monday, count in rows if monday is not None}
+
+    # Service directory management methods
+    def get_service(self, service_code: str) -> Optional[Dict]:
+        """Get a service by code."""
+        rows = self._select(
+            f"SELECT {', '.join(SERVICE_COLUMNS)} FROM services WHERE code = ?", (service_code,)
+        )
+        return rows[0] if rows else None
+
+    def search_services(self, search_term: str, limit: Optional[int] = None) -> List[Dict]:
+        """Search services by code or name, ranked like the JSON store's trigram search."""
+        term = search_term.lower()
+        return self._select(
+            f"SELECT {', '.join(SERVICE_COLUMNS)} FROM services "
+            "WHERE instr(lower(code), :term) OR instr(lower(name), :term) "
+            "ORDER BY CASE WHEN lower(code) = :term OR lower(name) = :term THEN 0 "
+            "WHEN instr(lower(code), :term) = 1 OR instr(lower(name), :term) = 1 THEN 1 "
+            "WHEN instr(lower(name), ' ' || :term) THEN 2 ELSE 3 END, rowid LIMIT :limit",
+            {'term': term, 'limit': -1 if limit is None else limit}
+        )
+
+    def add_service(self, code: str, name: str, fee: float) -> bool:
+        """Add a new service to the directory."""
+        try:
+            with self._transaction():
+                self.conn.execute(
+                    "INSERT INTO services (code, name, fee) VALUES (?, ?, ?)", (code, name, fee)
+                )
+                self._row_changed('services', code, ADDED)
+        except sqlite3.IntegrityError:
+            return False  # Service code already exists
+        return True
+
+    def update_service(self, code: str, **kwargs) -> bool:
+        """Update service information."""
+        return self._update_row('services', 'code', code, SERVICE_COLUMNS[1:], kwargs)
+
+    def delete_service(self, code: str) -> bool:
+        """Delete a service from the directory."""
+        return self._delete_row('services', 'code', code)
+
+    def _complete(self, table: str, key_column: str, prefix: str, limit: int) -> List[str]:
+        """Return up to limit keys starting with prefix, read as a range of the primary key."""
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT {key_column} FROM {table} WHERE {key_column} >= ? AND {key_column} < ? "
+                f"ORDER BY {key_column} LIMIT ?", (prefix, prefix + '\U0010ffff', limit)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def complete_member_ids(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return up to limit member IDs starting with prefix, in order."""
+        return self._complete('members', 'member_id', prefix, limit)
+
+    def complete_service_codes(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return up to limit service codes starting with prefix, in order."""
+        return self._complete('services', 'code', prefix, limit)
+
+    def search_members(self, query: str, limit: int = 20) -> List[Dict]:
+        """Find members by name or address, tolerating typos; best matches first.
+
+        The trigram index is built from the table on the first search, kept
+        current by this connection's changes and rebuilt once another
+        connection has committed (PRAGMA data_version changed).
+        """
+        with self._lock:
+            version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._member_index is None or version != self._member_index_version:
+                index = TrigramIndex(TEXT_INDEXES['members'])
+                for row in self._select("SELECT member_id, name, address FROM members ORDER BY rowid"):
+                    index.add(row['member_id'], row)
+                self._member_index, self._member_index_version = index, version
+            member_ids = [member_id for member_id, _ in self._member_index.similar(query, limit)]
+        if not member_ids:
+            return []
+        rows = self._select(
+            f"SELECT {', '.join(MEMBER_COLUMNS)} FROM members "
+            f"WHERE member_id IN ({', '.join('?' for _ in member_ids)})", member_ids
+        )
+        by_id = {row['member_id']: row for row in rows}
+        return [by_id[member_id] for member_id in member_ids if member_id in by_id]
+
+    # Utility methods
+    def find_members(self, status: Optional[str] = None, state: Optional[str] = None,
+                     zip_code: Optional[str] = None) -> List[Dict]:
+        """Find members matching every given field using the status/state/zip indexes."""
+        criteria = {'status': status, 'state': state.upper() if state else state, 'zip': zip_code}
+        conditions = [(column, value) for column, value in criteria.items() if value is not None]
+        where = ' AND '.join(f"{column} = ?" for column, _ in conditions) or '1'
+        return self._select(
+            f"SELECT {', '.join(MEMBER_COLUMNS)} FROM members WHERE {where} ORDER BY rowid",
+            tuple(value for _, value in conditions)
+        )
+
+    def get_expired_members(self) -> List[Dict]:
+        """Get all expired members."""
+        return self.find_members(status='Expired')
+
+    def get_valid_members(self) -> List[Dict]:
+        """Get all valid members."""
+        return self.find_members(status='Valid')
+
+    def get_pending_claims(self) -> List[Dict]:
+        """Get all pending service claims."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM service_claims WHERE status = 'Pending' ORDER BY claim_id"
+            ).fetchall()
+        return [self._claim_from_row(row) for row in rows]
+
+    def get_approved_claims(self) -> List[Dict]:
+        """Get all approved service claims."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM service_claims WHERE status = 'Approved' ORDER BY claim_id"
+            ).fetchall()
+        return [self._claim_from_row(row) for row in rows]
+
+    def backup_data(self, backup_dir: str = "backup", compression: Optional[str] = None,
+                    keep_daily: Optional[int] = None, keep_weekly: Optional[int] = None) -> str:
+        """Back up the database using SQLite's online backup API.
+        
+        The online backup goes to a scratch copy in the data directory, which
+        is then stored like the JSON files (compressed if asked) and removed.
+        """
+        scratch_dir = os.path.join(self.data_dir, '.backup')
+        scratch = os.path.join(scratch_dir, os.path.basename(self.db_file))
+        with self._backup_lock:
+            os.makedirs(scratch_dir, exist_ok=True)
+            target = sqlite3.connect(scratch)
+            try:
+                with self._lock:
+                    self.conn.backup(target)
+            finally:
+                target.close()
+            try:
+                backup_path = create_backup(scratch_dir, [scratch], backup_dir, compression)
+            finally:
+                os.remove(scratch)
+                os.rmdir(scratch_dir)
+            if keep_daily is not None or keep_weekly is not None:
+                prune_backups(backup_dir, keep_daily or 0, keep_weekly or 0)
+            self.last_backup = backup_path
+        return backup_path